@@ -1,14 +1,27 @@
 import pygame
 import sys
 import random
-import math
-import array
 import struct
+from collections import deque
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; fall back to plain Python kernels
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # --- Constants ---
 SCREEN_WIDTH = 400
 SCREEN_HEIGHT = 400
 FPS = 60
+DT = 1.0 / FPS # Fixed logic step
+MAX_STEPS = 5 # Logic steps allowed to catch up after a hitch
+IDLE_FPS = 30 # Menus and static screens
+HUD_RECT = (0, 0, SCREEN_WIDTH, 30)
 BLOCK_SIZE = 20
 GRID_WIDTH = SCREEN_WIDTH // BLOCK_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // BLOCK_SIZE
@@ -32,19 +45,35 @@ STATE_HOW_TO = 2
 STATE_CREDITS = 3
 STATE_GAMEOVER = 4
 STATE_KILL_SCREEN = 5
+STATE_DEATH_PAUSE = 6
 
 # Directions
-UP = (0, -1)
-DOWN = (0, 1)
-LEFT = (-1, 0)
-RIGHT = (1, 0)
-STOP = (0, 0)
+UP = 0
+DOWN = 1
+LEFT = 2
+RIGHT = 3
+STOP = 4
+DIR_DX = (0, 0, -1, 1, 0)
+DIR_DY = (-1, 1, 0, 0, 0)
+DIR_REV = (DOWN, UP, RIGHT, LEFT, STOP)
+DIR_STEP = tuple(dy * GRID_WIDTH + dx for dx, dy in zip(DIR_DX, DIR_DY)) # Flat-grid index offset
 
 # Ghost Modes
 MODE_SCATTER = 0
 MODE_CHASE = 1
 MODE_FRIGHTENED = 2
 
+# Ghost Kinds
+BLINKY = 0
+PINKY = 1
+INKY = 2
+CLYDE = 3
+GHOST_KINDS = {"blinky": BLINKY, "pinky": PINKY, "inky": INKY, "clyde": CLYDE}
+SCATTER_TARGETS = ((GRID_WIDTH-2, -2), (2, -2), (GRID_WIDTH-1, GRID_HEIGHT-1), (0, GRID_HEIGHT-1))
+
+# Synthesized sounds, shared by every SoundManager for the process lifetime
+_SOUND_CACHE = {}
+
 # Sound Manager
 class SoundManager:
     def __init__(self):
@@ -66,74 +95,154 @@ class SoundManager:
         self.sounds['power'] = self.make_sound(300, 0.5, 0.1, 'sine')
 
     def make_sound(self, freq, duration, vol, type='square'):
+        key = (type, freq, duration, vol)
+        if key in _SOUND_CACHE:
+            return _SOUND_CACHE[key]
         sample_rate = 44100
         n_samples = int(sample_rate * duration)
-        buf = array.array('h')
-        for i in range(n_samples):
-            t = float(i) / sample_rate
-            if type == 'square':
-                val = 1 if (int(t * freq * 2) % 2) == 0 else -1
-            else:
-                val = math.sin(2 * math.pi * freq * t)
-            buf.append(int(val * vol * 32767))
-        return pygame.mixer.Sound(buffer=buf)
+        t = np.arange(n_samples, dtype=np.float32) / sample_rate
+        if type == 'square':
+            val = np.where((t * freq * 2).astype(np.int32) & 1, -1.0, 1.0)
+        else:
+            val = np.sin(2 * np.pi * freq * t)
+        _SOUND_CACHE[key] = self.to_sound(val, vol)
+        return _SOUND_CACHE[key]
 
     def make_slide(self, start_freq, end_freq, duration, vol):
+        key = ('slide', start_freq, end_freq, duration, vol)
+        if key in _SOUND_CACHE:
+            return _SOUND_CACHE[key]
         sample_rate = 44100
         n_samples = int(sample_rate * duration)
-        buf = array.array('h')
-        for i in range(n_samples):
-            t = float(i) / sample_rate
-            progress = i / n_samples
-            freq = start_freq + (end_freq - start_freq) * progress
-            val = 1 if (int(t * freq * 2) % 2) == 0 else -1
-            buf.append(int(val * vol * 32767))
-        return pygame.mixer.Sound(buffer=buf)
+        freq = np.linspace(start_freq, end_freq, n_samples, endpoint=False)
+        phase = np.cumsum(freq) / sample_rate
+        val = np.where((phase * 2).astype(np.int32) & 1, -1.0, 1.0)
+        _SOUND_CACHE[key] = self.to_sound(val, vol)
+        return _SOUND_CACHE[key]
         
     def make_arpeggio(self, freqs, note_len, vol):
+        key = ('arpeggio', tuple(freqs), note_len, vol)
+        if key in _SOUND_CACHE:
+            return _SOUND_CACHE[key]
         sample_rate = 44100
         total_samples = int(sample_rate * note_len * len(freqs))
-        buf = array.array('h')
         samples_per_note = int(sample_rate * note_len)
         
-        for i in range(total_samples):
-            note_idx = (i // samples_per_note) % len(freqs)
-            freq = freqs[note_idx]
-            t = float(i) / sample_rate
-            val = 1 if (int(t * freq * 2) % 2) == 0 else -1
-            buf.append(int(val * vol * 32767))
-        return pygame.mixer.Sound(buffer=buf)
+        freqs_arr = np.asarray(freqs, dtype=np.float32)
+        idx = np.arange(total_samples)
+        freq = freqs_arr[(idx // samples_per_note) % len(freqs)]
+        t = idx.astype(np.float32) / sample_rate
+        val = np.where((t * freq * 2).astype(np.int32) & 1, -1.0, 1.0)
+        _SOUND_CACHE[key] = self.to_sound(val, vol)
+        return _SOUND_CACHE[key]
+
+    def to_sound(self, val, vol):
+        buf = (val * (vol * 32767)).astype(np.int16)
+        return pygame.mixer.Sound(buffer=buf.tobytes())
 
     def play(self, name):
         if self.enabled and name in self.sounds:
             self.sounds[name].play()
 
-# Map Layout (0: Empty, 1: Wall, 2: Pellet, 3: Power Pellet)
+# Map Layout: separate wall, pellet and power-pellet layers (1 = present)
+# Stored flat, row-major: tile (x, y) lives at layer[y * GRID_WIDTH + x]
 def generate_map():
-    layout = []
+    walls = bytearray(GRID_WIDTH * GRID_HEIGHT)
+    pellets = bytearray(GRID_WIDTH * GRID_HEIGHT)
+    powers = bytearray(GRID_WIDTH * GRID_HEIGHT)
     for y in range(GRID_HEIGHT):
-        row = []
         for x in range(GRID_WIDTH):
+            i = y * GRID_WIDTH + x
             if x == 0 or x == GRID_WIDTH - 1 or y == 0 or y == GRID_HEIGHT - 1:
-                row.append(1) # Border
+                walls[i] = 1 # Border
             elif x % 4 == 0 and y % 4 == 0:
-                row.append(1) # Pillars
+                walls[i] = 1 # Pillars
             elif (x == 1 or x == GRID_WIDTH - 2) and (y == 1 or y == GRID_HEIGHT - 2):
-                row.append(3) # Power Pellet
+                powers[i] = 1 # Power Pellet
             else:
-                row.append(2) # Pellet
-        layout.append(row)
+                pellets[i] = 1 # Pellet
     
     # Clear center for ghost house
     cx, cy = GRID_WIDTH // 2, GRID_HEIGHT // 2
     for y in range(cy - 2, cy + 2):
         for x in range(cx - 3, cx + 3):
-            layout[y][x] = 0
+            i = y * GRID_WIDTH + x
+            walls[i] = pellets[i] = powers[i] = 0
     
     # Ghost house door
-    layout[cy - 2][cx] = 0
+    i = (cy - 2) * GRID_WIDTH + cx
+    walls[i] = pellets[i] = powers[i] = 0
     
-    return layout
+    return walls, pellets, powers
+
+# Bit d set when the neighbour in direction d is inside the maze and not a wall
+def build_walk_mask(walls):
+    mask = bytearray(GRID_WIDTH * GRID_HEIGHT)
+    for y in range(GRID_HEIGHT):
+        for x in range(GRID_WIDTH):
+            bits = 0
+            for d in range(4):
+                nx, ny = x + DIR_DX[d], y + DIR_DY[d]
+                if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT and not walls[ny * GRID_WIDTH + nx]:
+                    bits |= 1 << d
+            mask[y * GRID_WIDTH + x] = bits
+    return mask
+
+UNREACHED = 255
+
+# Step count from start to every tile, walking the open neighbours in walk_mask
+def bfs_distances(walk_mask, start_x, start_y):
+    dist = bytearray([UNREACHED]) * (GRID_WIDTH * GRID_HEIGHT)
+    start = start_y * GRID_WIDTH + start_x
+    dist[start] = 0
+    queue = deque([start])
+    while queue:
+        i = queue.popleft()
+        bits = walk_mask[i]
+        step = min(dist[i] + 1, UNREACHED - 1)
+        for d in range(4):
+            if bits >> d & 1:
+                n = i + DIR_STEP[d]
+                if dist[n] == UNREACHED:
+                    dist[n] = step
+                    queue.append(n)
+    return dist
+
+@njit(cache=True)
+def choose_dir(gx, gy, rev_dir, walk_mask, gw, tx, ty):
+    # Greedy ghost step: the open, non-reversing neighbour closest to the target
+    best = rev_dir
+    min_dist = 1e18
+    bits = walk_mask[gy * gw + gx]
+    for d in range(4):
+        # Don't reverse immediately
+        if d == rev_dir or not (bits >> d) & 1:
+            continue
+        cx = gx + DIR_DX[d]
+        cy = gy + DIR_DY[d]
+        dist = (cx - tx) ** 2 + (cy - ty) ** 2
+        if dist < min_dist:
+            min_dist = dist
+            best = d
+    # Dead end (shouldn't happen in standard maze) falls back to reversing
+    return best
+
+@njit(cache=True)
+def follow_field(gx, gy, rev_dir, walk_mask, dist_field, gw):
+    # Walk downhill on a BFS distance field: the open, non-reversing neighbour fewest steps away
+    best = rev_dir
+    min_dist = 256
+    i = gy * gw + gx
+    bits = walk_mask[i]
+    for d in range(4):
+        # Don't reverse immediately
+        if d == rev_dir or not (bits >> d) & 1:
+            continue
+        dist = dist_field[i + DIR_DY[d] * gw + DIR_DX[d]]
+        if dist < min_dist:
+            min_dist = dist
+            best = d
+    return best
 
 class Game:
     def __init__(self):
@@ -144,36 +253,89 @@ class Game:
         self.font_big = pygame.font.SysFont("Arial", 48, bold=True)
         self.font_med = pygame.font.SysFont("Arial", 32, bold=True)
         self.font_small = pygame.font.SysFont("Courier New", 20)
+        # Printable ASCII glyphs for the kill screen garbage
+        self.glyph_cache = [self.font_small.render(chr(c), True, WHITE).convert_alpha() for c in range(33, 127)]
+        self.np_rng = np.random.default_rng()
+        self.rng = random.Random(12345) # Ghost decisions; private to this game
         
         self.sfx = SoundManager()
         self.state = STATE_MENU
         self.menu_options = ["PLAY GAME", "HOW TO PLAY", "CREDITS", "EXIT GAME"]
         self.selected_option = 0
         
+        # Static menu text, rendered once; each option in (unselected, selected) form
+        self.title_surf = self.font_big.render("PAC-MAN HDR 4K", True, YELLOW).convert_alpha()
+        self.subtitle_surf = self.font_med.render("BANDAI NAMCO", True, NAMCO_RED).convert_alpha()
+        self.footer_surf = self.font_small.render("REAL SFX | FULL ENGINE", True, CYAN).convert_alpha()
+        self.option_surfs = [(self.font_med.render("  " + option, True, (100, 100, 100)).convert_alpha(),
+                              self.font_med.render("> " + option, True, WHITE).convert_alpha())
+                             for option in self.menu_options]
+        self._hud_cache = {}
+        # Dirty-rect presentation: only areas touched this frame or last are pushed
+        self.dirty_rects = []
+        self._prev_sprite_rects = []
+        self._eaten_rects = [] # pellet tiles erased since the last frame
+        self._full_redraw = True
+        self._last_drawn_state = None
+        
         self.reset_game()
         
     def reset_game(self):
         self.score = 0
         self.level = 1
         self.lives = 3
-        self.grid = generate_map()
+        self.build_level()
         self.pacman = Entity(GRID_WIDTH // 2, GRID_HEIGHT // 2 + 4, YELLOW, is_pacman=True)
         self.ghosts = [
-            Ghost(GRID_WIDTH // 2, GRID_HEIGHT // 2 - 2, RED, "blinky"),
-            Ghost(GRID_WIDTH // 2 - 1, GRID_HEIGHT // 2, PINK, "pinky"),
-            Ghost(GRID_WIDTH // 2 + 1, GRID_HEIGHT // 2, CYAN, "inky"),
-            Ghost(GRID_WIDTH // 2, GRID_HEIGHT // 2, ORANGE, "clyde")
+            Ghost(GRID_WIDTH // 2, GRID_HEIGHT // 2 - 2, RED, "blinky", self.rng),
+            Ghost(GRID_WIDTH // 2 - 1, GRID_HEIGHT // 2, PINK, "pinky", self.rng),
+            Ghost(GRID_WIDTH // 2 + 1, GRID_HEIGHT // 2, CYAN, "inky", self.rng),
+            Ghost(GRID_WIDTH // 2, GRID_HEIGHT // 2, ORANGE, "clyde", self.rng)
         ]
         self.mode_timer = 0
         self.ghost_mode = MODE_SCATTER
         self.frightened_timer = 0
+        self.death_pause_until = 0
+
+    def build_level(self):
+        self.walls, self.pellets, self.powers = generate_map()
+        self.walk_mask = build_walk_mask(self.walls)
+        self._full_redraw = True
+        self.pac_dist = None
+        self.pac_dist_tile = None
+        # Walls and pellets are rendered once; eaten pellets are blacked out in place
+        self.maze_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.maze_surface.fill(BLACK)
+        self.power_positions = set()
+        for y in range(GRID_HEIGHT):
+            for x in range(GRID_WIDTH):
+                i = y * GRID_WIDTH + x
+                if self.walls[i]:
+                    pygame.draw.rect(self.maze_surface, BLUE, (x*BLOCK_SIZE, y*BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE), 1)
+                elif self.pellets[i]:
+                    pygame.draw.circle(self.maze_surface, PINK, (x*BLOCK_SIZE + BLOCK_SIZE//2, y*BLOCK_SIZE + BLOCK_SIZE//2), 2)
+                elif self.powers[i]:
+                    self.power_positions.add((x, y))
+        self.pellets_left = self.pellets.count(1)
+        self.power_left = len(self.power_positions)
 
     def run(self):
+        accum = 0.0
+        in_game = (STATE_PLAYING, STATE_DEATH_PAUSE)
         while True:
             self.handle_events()
-            self.update()
+            if self.state in in_game:
+                # Fixed-timestep logic, decoupled from the render rate.
+                # During the death pause update() only watches the pause timer.
+                accum = min(accum + self.clock.tick(FPS) / 1000.0, MAX_STEPS * DT)
+                while accum >= DT and self.state in in_game:
+                    self.update()
+                    accum -= DT
+            else:
+                # Menus and static screens have no logic step; just redraw at a lower rate
+                self.clock.tick(IDLE_FPS)
+                accum = 0.0
             self.draw()
-            self.clock.tick(FPS)
 
     def handle_events(self):
         for event in pygame.event.get():
@@ -219,7 +381,13 @@ class Game:
             sys.exit()
 
     def update(self):
-        if self.state == STATE_PLAYING:
+        if self.state == STATE_DEATH_PAUSE:
+            # Hold the death frame without blocking the event loop
+            if pygame.time.get_ticks() >= self.death_pause_until:
+                self.pacman.reset_pos()
+                for g in self.ghosts: g.reset_pos()
+                self.state = STATE_GAMEOVER if self.lives <= 0 else STATE_PLAYING
+        elif self.state == STATE_PLAYING:
             # Ghost Mode Logic (Scatter/Chase alternation)
             if self.ghost_mode != MODE_FRIGHTENED:
                 self.mode_timer += 1
@@ -235,18 +403,24 @@ class Game:
                     self.ghost_mode = MODE_CHASE
                     self.mode_timer = 0
 
-            self.pacman.update(self.grid)
+            self.pacman.update(self.walls)
+            
+            # Shared distance field to Pac-Man, rebuilt only when he changes tile
+            pac_tile = (int(self.pacman.x + 0.5) % GRID_WIDTH, int(self.pacman.y + 0.5) % GRID_HEIGHT)
+            if pac_tile != self.pac_dist_tile:
+                self.pac_dist = bfs_distances(self.walk_mask, *pac_tile)
+                self.pac_dist_tile = pac_tile
             
             # Update Ghosts
             blinky = self.ghosts[0]
             for ghost in self.ghosts:
-                ghost.update_ai(self.grid, self.pacman, blinky, self.ghost_mode)
+                ghost.update_ai(self.walk_mask, self.pac_dist, self.pacman, blinky, self.ghost_mode)
                 
-                # Collision Check
-                pac_rect = pygame.Rect(self.pacman.x * BLOCK_SIZE + 4, self.pacman.y * BLOCK_SIZE + 4, 12, 12)
-                ghost_rect = pygame.Rect(ghost.x * BLOCK_SIZE + 4, ghost.y * BLOCK_SIZE + 4, 12, 12)
+                # Collision Check (12px hitboxes on 20px tiles overlap within 0.6 tiles)
+                dx = self.pacman.x - ghost.x
+                dy = self.pacman.y - ghost.y
                 
-                if pac_rect.colliderect(ghost_rect):
+                if -0.6 < dx < 0.6 and -0.6 < dy < 0.6:
                     if self.ghost_mode == MODE_FRIGHTENED:
                         # Eat Ghost
                         ghost.reset_pos()
@@ -256,27 +430,33 @@ class Game:
                         # Death
                         self.lives -= 1
                         self.sfx.play('death')
-                        self.pacman.reset_pos()
-                        for g in self.ghosts: g.reset_pos()
-                        pygame.time.delay(1000)
-                        if self.lives <= 0:
-                            self.state = STATE_GAMEOVER
+                        self.death_pause_until = pygame.time.get_ticks() + 1000
+                        self.state = STATE_DEATH_PAUSE
+                        return
             
             # Eat pellets
             px, py = int(self.pacman.x + 0.5), int(self.pacman.y + 0.5)
-            if self.grid[py][px] == 2:
-                self.grid[py][px] = 0
+            i = py * GRID_WIDTH + px
+            if self.pellets[i] or self.powers[i]:
+                # Pac-Man's sprite rect can trail the rounded tile he eats, so push the tile itself
+                self._eaten_rects.append((px*BLOCK_SIZE, py*BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE))
+            if self.pellets[i]:
+                self.pellets[i] = 0
+                self.maze_surface.fill(BLACK, (px*BLOCK_SIZE, py*BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE))
+                self.pellets_left -= 1
                 self.score += 10
                 self.sfx.play('waka')
-            elif self.grid[py][px] == 3: # Power Pellet
-                self.grid[py][px] = 0
+            elif self.powers[i]: # Power Pellet
+                self.powers[i] = 0
+                self.power_positions.discard((px, py))
+                self.power_left -= 1
                 self.score += 50
                 self.ghost_mode = MODE_FRIGHTENED
                 self.frightened_timer = 600 # 10 seconds
                 self.sfx.play('power')
                 
             # Check level complete
-            if not any(2 in row for row in self.grid) and not any(3 in row for row in self.grid):
+            if self.pellets_left == 0 and self.power_left == 0:
                 self.next_level()
     
     def next_level(self):
@@ -284,7 +464,7 @@ class Game:
         if self.level >= 256:
             self.state = STATE_KILL_SCREEN
         else:
-            self.grid = generate_map()
+            self.build_level()
             self.pacman.reset_pos()
             for ghost in self.ghosts:
                 ghost.reset_pos()
@@ -294,7 +474,7 @@ class Game:
         
         if self.state == STATE_MENU:
             self.draw_menu()
-        elif self.state == STATE_PLAYING:
+        elif self.state in (STATE_PLAYING, STATE_DEATH_PAUSE):
             self.draw_game()
         elif self.state == STATE_HOW_TO:
             self.draw_text_screen("HOW TO PLAY", ["Arrow Keys to Move", "Eat all pellets", "Power Pellets = Eat Ghosts", "REAL SFX: ON", "ENGINE: COMPLETE"])
@@ -305,44 +485,60 @@ class Game:
         elif self.state == STATE_KILL_SCREEN:
             self.draw_kill_screen()
             
-        pygame.display.flip()
+        in_game = (STATE_PLAYING, STATE_DEATH_PAUSE)
+        if self.state in in_game and self._last_drawn_state in in_game and not self._full_redraw:
+            pygame.display.update(self.dirty_rects)
+        else:
+            pygame.display.flip()
+        self._full_redraw = False
+        self._last_drawn_state = self.state
 
     def draw_menu(self):
-        title = self.font_big.render("PAC-MAN HDR 4K", True, YELLOW)
-        subtitle = self.font_med.render("BANDAI NAMCO", True, NAMCO_RED)
+        title = self.title_surf
+        subtitle = self.subtitle_surf
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 50))
         self.screen.blit(subtitle, (SCREEN_WIDTH//2 - subtitle.get_width()//2, 110))
         
-        for i, option in enumerate(self.menu_options):
-            color = WHITE if i == self.selected_option else (100, 100, 100)
-            prefix = "> " if i == self.selected_option else "  "
-            text = self.font_med.render(prefix + option, True, color)
+        for i, surfs in enumerate(self.option_surfs):
+            text = surfs[i == self.selected_option]
             self.screen.blit(text, (SCREEN_WIDTH//2 - 100, 200 + i * 40))
             
-        footer = self.font_small.render("REAL SFX | FULL ENGINE", True, CYAN)
+        footer = self.footer_surf
         self.screen.blit(footer, (SCREEN_WIDTH//2 - footer.get_width()//2, 360))
 
+    def hud_text(self, label, value):
+        # Re-render a HUD field only when its value changes
+        cached = self._hud_cache.get(label)
+        if cached is None or cached[0] != value:
+            cached = (value, self.font_small.render(f"{label}: {value}", True, WHITE).convert_alpha())
+            self._hud_cache[label] = cached
+        return cached[1]
+
     def draw_game(self):
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                if self.grid[y][x] == 1:
-                    pygame.draw.rect(self.screen, BLUE, (x*BLOCK_SIZE, y*BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE), 1)
-                elif self.grid[y][x] == 2:
-                    pygame.draw.circle(self.screen, PINK, (x*BLOCK_SIZE + BLOCK_SIZE//2, y*BLOCK_SIZE + BLOCK_SIZE//2), 2)
-                elif self.grid[y][x] == 3:
-                    if (pygame.time.get_ticks() // 200) % 2 == 0: # Blink
-                        pygame.draw.circle(self.screen, WHITE, (x*BLOCK_SIZE + BLOCK_SIZE//2, y*BLOCK_SIZE + BLOCK_SIZE//2), 6)
+        self.screen.blit(self.maze_surface, (0, 0))
+        if (pygame.time.get_ticks() // 200) & 1 == 0: # Blink
+            for x, y in self.power_positions:
+                pygame.draw.circle(self.screen, WHITE, (x*BLOCK_SIZE + BLOCK_SIZE//2, y*BLOCK_SIZE + BLOCK_SIZE//2), 6)
         
         self.pacman.draw(self.screen)
         for ghost in self.ghosts:
             ghost.draw(self.screen, self.ghost_mode)
             
-        score_text = self.font_small.render(f"SCORE: {self.score}", True, WHITE)
-        level_text = self.font_small.render(f"LVL: {self.level}", True, WHITE)
-        lives_text = self.font_small.render(f"LIVES: {self.lives}", True, WHITE)
+        score_text = self.hud_text("SCORE", self.score)
+        level_text = self.hud_text("LVL", self.level)
+        lives_text = self.hud_text("LIVES", self.lives)
         self.screen.blit(score_text, (10, 5))
         self.screen.blit(level_text, (SCREEN_WIDTH//2 - 20, 5))
         self.screen.blit(lives_text, (SCREEN_WIDTH - 100, 5))
+        
+        # Sprites where they are now and where they were, tiles eaten since the last
+        # frame, the blinking power pellets and the HUD strip
+        sprite_rects = [self.pacman.screen_rect()] + [ghost.screen_rect() for ghost in self.ghosts]
+        self.dirty_rects = sprite_rects + self._prev_sprite_rects + self._eaten_rects
+        self._eaten_rects = []
+        self.dirty_rects.extend((x*BLOCK_SIZE, y*BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE) for x, y in self.power_positions)
+        self.dirty_rects.append(HUD_RECT)
+        self._prev_sprite_rects = sprite_rects
 
     def draw_text_screen(self, title_str, lines):
         title = self.font_big.render(title_str, True, YELLOW)
@@ -353,16 +549,15 @@ class Game:
 
     def draw_kill_screen(self):
         self.screen.fill(BLACK)
-        for _ in range(100):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            w = random.randint(10, 50)
-            h = random.randint(10, 50)
-            color = (random.randint(0,255), random.randint(0,255), random.randint(0,255))
-            pygame.draw.rect(self.screen, color, (x, y, w, h))
-            char = chr(random.randint(33, 126))
-            text = self.font_small.render(char, True, WHITE)
-            self.screen.blit(text, (random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT)))
+        rng = self.np_rng
+        rects = np.column_stack((rng.integers(0, SCREEN_WIDTH + 1, 100), rng.integers(0, SCREEN_HEIGHT + 1, 100),
+                                 rng.integers(10, 51, (100, 2)))).tolist()
+        colors = rng.integers(0, 256, (100, 3)).tolist()
+        glyphs = rng.integers(0, len(self.glyph_cache), 100).tolist()
+        glyph_pos = np.column_stack((rng.integers(0, SCREEN_WIDTH + 1, 100), rng.integers(0, SCREEN_HEIGHT + 1, 100))).tolist()
+        for rect, color, glyph, pos in zip(rects, colors, glyphs, glyph_pos):
+            pygame.draw.rect(self.screen, color, rect)
+            self.screen.blit(self.glyph_cache[glyph], pos)
         msg = self.font_big.render("LEVEL 256 FATAL ERROR", True, RED)
         self.screen.blit(msg, (SCREEN_WIDTH//2 - msg.get_width()//2, SCREEN_HEIGHT//2))
 
@@ -385,28 +580,28 @@ class Entity:
         self.dir = STOP
         self.next_dir = STOP
 
-    def update(self, grid):
+    def update(self, walls):
         if self.next_dir != STOP:
             # Only turn if centered on tile
             if abs(self.x - round(self.x)) < 0.1 and abs(self.y - round(self.y)) < 0.1:
-                check_x = int(round(self.x) + self.next_dir[0])
-                check_y = int(round(self.y) + self.next_dir[1])
+                check_x = int(round(self.x) + DIR_DX[self.next_dir])
+                check_y = int(round(self.y) + DIR_DY[self.next_dir])
                 if 0 <= check_x < GRID_WIDTH and 0 <= check_y < GRID_HEIGHT:
-                    if grid[check_y][check_x] != 1:
+                    if not walls[check_y * GRID_WIDTH + check_x]:
                         self.x = round(self.x) # Snap to grid
                         self.y = round(self.y)
                         self.dir = self.next_dir
                         self.next_dir = STOP
 
         if self.dir != STOP:
-            new_x = self.x + self.dir[0] * self.speed
-            new_y = self.y + self.dir[1] * self.speed
+            new_x = self.x + DIR_DX[self.dir] * self.speed
+            new_y = self.y + DIR_DY[self.dir] * self.speed
             
             center_x = int(new_x + 0.5)
             center_y = int(new_y + 0.5)
             
             if 0 <= center_x < GRID_WIDTH and 0 <= center_y < GRID_HEIGHT:
-                if grid[center_y][center_x] != 1:
+                if not walls[center_y * GRID_WIDTH + center_x]:
                     self.x = new_x
                     self.y = new_y
                 else:
@@ -416,6 +611,9 @@ class Entity:
                 self.x = new_x % GRID_WIDTH
                 self.y = new_y % GRID_HEIGHT
 
+    def screen_rect(self):
+        return (int(self.x * BLOCK_SIZE), int(self.y * BLOCK_SIZE), BLOCK_SIZE, BLOCK_SIZE)
+
     def draw(self, screen):
         px = int(self.x * BLOCK_SIZE + BLOCK_SIZE // 2)
         py = int(self.y * BLOCK_SIZE + BLOCK_SIZE // 2)
@@ -423,110 +621,104 @@ class Entity:
         pygame.draw.circle(screen, self.color, (px, py), radius)
 
 class Ghost(Entity):
-    def __init__(self, x, y, color, name):
+    def __init__(self, x, y, color, name, rng):
         super().__init__(x, y, color, is_pacman=False)
         self.name = name
+        self.rng = rng
+        self.kind = GHOST_KINDS[name]
         self.speed = 0.1
         self.dir = LEFT # Initial move
+        self.radius = BLOCK_SIZE // 2 - 2
+        # One sprite per (frightened, direction); the pupils follow the direction
+        self.sprites = {(frightened, d): self.render_sprite(PURPLE if frightened else color, d)
+                        for frightened in (False, True) for d in range(5)}
+        
+    def render_sprite(self, color, d):
+        r = self.radius
+        surf = pygame.Surface((r*2, r*2)).convert()
+        surf.fill(color)
+        
+        # Eyes
+        pygame.draw.circle(surf, WHITE, (r - 4, r - 2), 3)
+        pygame.draw.circle(surf, WHITE, (r + 4, r - 2), 3)
+        look_x, look_y = DIR_DX[d] * 2, DIR_DY[d] * 2
+        pygame.draw.circle(surf, BLUE, (r - 4 + look_x, r - 2 + look_y), 1)
+        pygame.draw.circle(surf, BLUE, (r + 4 + look_x, r - 2 + look_y), 1)
+        return surf
         
     def reverse(self):
-        self.dir = (-self.dir[0], -self.dir[1])
+        self.dir = DIR_REV[self.dir]
         
-    def update_ai(self, grid, pacman, blinky, mode):
-        # Move forward
-        new_x = self.x + self.dir[0] * self.speed
-        new_y = self.y + self.dir[1] * self.speed
+    def update_ai(self, walk_mask, pac_dist, pacman, blinky, mode):
+        # Between tiles there is nothing to decide: keep moving (with warp).
+        # The window is half a step wide so a ghost leaves the tile it just decided on.
+        snap = self.speed / 2
+        if abs(self.x - round(self.x)) >= snap or abs(self.y - round(self.y)) >= snap:
+            self.x = (self.x + DIR_DX[self.dir] * self.speed) % GRID_WIDTH
+            self.y = (self.y + DIR_DY[self.dir] * self.speed) % GRID_HEIGHT
+            return
         
-        # Check if centered on tile (decision point)
-        if abs(self.x - round(self.x)) < 0.1 and abs(self.y - round(self.y)) < 0.1:
-            self.x = round(self.x)
-            self.y = round(self.y)
-            
-            # Choose next direction
+        # Centered on tile (decision point)
+        self.x = round(self.x)
+        self.y = round(self.y)
+        
+        # Choose next direction
+        rev_dir = DIR_REV[self.dir]
+        if mode == MODE_FRIGHTENED:
+            bits = walk_mask[self.y * GRID_WIDTH + self.x]
             possible_dirs = []
-            for d in [UP, DOWN, LEFT, RIGHT]:
+            for d in range(4):
                 # Don't reverse immediately
-                if d == (-self.dir[0], -self.dir[1]): continue
-                
-                check_x = int(self.x + d[0])
-                check_y = int(self.y + d[1])
-                if 0 <= check_x < GRID_WIDTH and 0 <= check_y < GRID_HEIGHT:
-                    if grid[check_y][check_x] != 1:
-                        possible_dirs.append(d)
+                if d == rev_dir: continue
+                if bits >> d & 1:
+                    possible_dirs.append(d)
             
             if possible_dirs:
-                if mode == MODE_FRIGHTENED:
-                    self.dir = random.choice(possible_dirs)
-                else:
-                    target = self.get_target(pacman, blinky, mode)
-                    best_dir = possible_dirs[0]
-                    min_dist = float('inf')
-                    
-                    for d in possible_dirs:
-                        tx = self.x + d[0]
-                        ty = self.y + d[1]
-                        dist = (tx - target[0])**2 + (ty - target[1])**2
-                        if dist < min_dist:
-                            min_dist = dist
-                            best_dir = d
-                    self.dir = best_dir
+                self.dir = self.rng.choice(possible_dirs)
             else:
-                 # Dead end (shouldn't happen in standard maze)
-                 self.reverse()
-                 
-            # Apply move
-            self.x += self.dir[0] * self.speed
-            self.y += self.dir[1] * self.speed
+                # Dead end (shouldn't happen in standard maze)
+                self.reverse()
         else:
-            # Continue moving
-            self.x = new_x
-            self.y = new_y
-            
-            # Warp
-            self.x = self.x % GRID_WIDTH
-            self.y = self.y % GRID_HEIGHT
+            tx, ty = self.get_target(pacman, blinky, mode)
+            if mode == MODE_CHASE and tx == pacman.x and ty == pacman.y:
+                # Hunting Pac-Man himself: follow the real maze distance
+                self.dir = follow_field(self.x, self.y, rev_dir, walk_mask, pac_dist, GRID_WIDTH)
+            else:
+                self.dir = choose_dir(self.x, self.y, rev_dir, walk_mask,
+                                      GRID_WIDTH, float(tx), float(ty))
+             
+        # Apply move
+        self.x += DIR_DX[self.dir] * self.speed
+        self.y += DIR_DY[self.dir] * self.speed
 
     def get_target(self, pacman, blinky, mode):
         if mode == MODE_SCATTER:
             # Corners
-            if self.name == "blinky": return (GRID_WIDTH-2, -2)
-            if self.name == "pinky": return (2, -2)
-            if self.name == "inky": return (GRID_WIDTH-1, GRID_HEIGHT-1)
-            if self.name == "clyde": return (0, GRID_HEIGHT-1)
+            return SCATTER_TARGETS[self.kind]
         
         # Chase Mode
         px, py = pacman.x, pacman.y
-        pd_x, pd_y = pacman.dir
+        pd_x, pd_y = DIR_DX[pacman.dir], DIR_DY[pacman.dir]
         
-        if self.name == "blinky":
-            return (px, py)
-        elif self.name == "pinky":
-            return (px + pd_x * 4, py + pd_y * 4)
-        elif self.name == "inky":
-            vec_x = (px + pd_x * 2) - blinky.x
-            vec_y = (py + pd_y * 2) - blinky.y
-            return (blinky.x + vec_x * 2, blinky.y + vec_y * 2)
-        elif self.name == "clyde":
-            dist = (self.x - px)**2 + (self.y - py)**2
-            if dist > 64: # 8 tiles squared
-                return (px, py)
-            else:
-                return (0, GRID_HEIGHT-1) # Scatter target
-        return (px, py)
+        match self.kind:
+            case 1: # Pinky
+                return (px + pd_x * 4, py + pd_y * 4)
+            case 2: # Inky
+                vec_x = (px + pd_x * 2) - blinky.x
+                vec_y = (py + pd_y * 2) - blinky.y
+                return (blinky.x + vec_x * 2, blinky.y + vec_y * 2)
+            case 3: # Clyde
+                dist = (self.x - px)**2 + (self.y - py)**2
+                if dist > 64: # 8 tiles squared
+                    return (px, py)
+                return SCATTER_TARGETS[CLYDE]
+        return (px, py) # Blinky
 
     def draw(self, screen, mode):
         px = int(self.x * BLOCK_SIZE + BLOCK_SIZE // 2)
         py = int(self.y * BLOCK_SIZE + BLOCK_SIZE // 2)
-        radius = BLOCK_SIZE // 2 - 2
-        
-        color = PURPLE if mode == MODE_FRIGHTENED else self.color
-        pygame.draw.rect(screen, color, (px - radius, py - radius, radius*2, radius*2))
-        
-        # Eyes
-        pygame.draw.circle(screen, WHITE, (px - 4, py - 2), 3)
-        pygame.draw.circle(screen, WHITE, (px + 4, py - 2), 3)
-        pygame.draw.circle(screen, BLUE, (px - 4 + self.dir[0]*2, py - 2 + self.dir[1]*2), 1)
-        pygame.draw.circle(screen, BLUE, (px + 4 + self.dir[0]*2, py - 2 + self.dir[1]*2), 1)
+        sprite = self.sprites[(mode == MODE_FRIGHTENED, self.dir)]
+        screen.blit(sprite, (px - self.radius, py - self.radius))
 
 if __name__ == "__main__":
     game = Game()
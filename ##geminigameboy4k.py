@@ -1,7 +1,10 @@
 import tkinter as tk
+from tkinter import font as tkfont
 import random
+import math
 import time
 import datetime
+from collections import deque
 
 # --- Configuration & Constants ---
 SCALE = 2
@@ -30,6 +33,18 @@ GRID_SIZE = 8 * SCALE
 GRID_W = SCREEN_WIDTH // GRID_SIZE
 GRID_H = SCREEN_HEIGHT // GRID_SIZE
 
+# Button bits for the input masks
+K_UP = 1
+K_DOWN = 2
+K_LEFT = 4
+K_RIGHT = 8
+K_A = 16
+K_B = 32
+K_START = 64
+K_SELECT = 128
+BUTTON_BITS = {"UP": K_UP, "DOWN": K_DOWN, "LEFT": K_LEFT, "RIGHT": K_RIGHT,
+               "A": K_A, "B": K_B, "START": K_START, "SELECT": K_SELECT}
+
 # App States
 STATE_MENU = "MENU"
 STATE_SNAKE = "SNAKE"
@@ -51,20 +66,27 @@ class GameboySimulator:
         self.canvas = tk.Canvas(root, width=self.case_width, height=self.case_height, bg="white", highlightthickness=0)
         self.canvas.pack()
 
+        # Named fonts, built once so Tk doesn't re-parse a font tuple per item
+        self._fonts = {s: tkfont.Font(family="Courier", size=int(s*5), weight="bold") for s in (1, 2, 3, 4)}
+        self._calc_font = tkfont.Font(family="Courier", size=12, weight="bold")
+
         # Input State
-        self.keys = {"UP": False, "DOWN": False, "LEFT": False, "RIGHT": False, "A": False, "B": False, "START": False, "SELECT": False}
-        self.prev_keys = self.keys.copy() # To detect single presses
+        self.keys = 0 # Bitmask of held buttons
+        self.prev_keys = 0 # Previous frame, to detect single presses
+        self.pressed = 0 # Buttons that went down this frame
         self.mouse_pressed_btn = None # Track mouse input
         
         # System State
         self.current_state = STATE_MENU
         self.menu_items = ["SNAKE", "CLOCK", "NOTES", "CALC"]
+        self._menu_len = len(self.menu_items) # Fixed list, so computed once
         self.menu_index = 0
 
         # Snake State
         self.game_running = False
         self.game_over = False
-        self.snake = []
+        self.snake = deque() # Head first
+        self.snake_set = set() # Same cells, for O(1) hit tests
         self.food = None
         self.direction = (0, 0)
         self.next_direction = (0, 0)
@@ -73,9 +95,13 @@ class GameboySimulator:
         self.update_rate = 8
 
         # Notepad State
-        self.note_content = ""
+        self.note_content = "" # Joined view of _note_chars, refreshed on redraw
+        self._note_chars = [] # Edit buffer, so typing appends instead of copying the string
         self.note_char_idx = 1 # Start at 'A'
+        self._note_lines = [] # Visible wrapped lines, rebuilt when the note changes
+        self._notes_dirty = True
         self.CHAR_SET = " ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!?.-"
+        self._charset_len = len(self.CHAR_SET)
 
         # Calculator State
         self.calc_val = "0"
@@ -90,8 +116,24 @@ class GameboySimulator:
             'C', '0', '=', '+'
         ]
 
+        # Retained canvas items, keyed by (state, role[, index])
+        self.items = {}
+        self._item_state = {} # key -> (coords, opts) last pushed to Tk
+        self._shown = set()
+        self._frame_items = set()
+        self._pending_config = [] # (item, opts) queued by draw_item until the frame flush
+        self._pending_coords = [] # (item, coords) likewise, applied after all configures
+        self._prev_state = None # State whose items are on screen
+        self.dirty = True # Redraw needed
+        self._last_now_sec = None
+        self._after_id = None # Pending game_loop callback
+        self._idle = False # Sleeping until the next deadline rather than the next frame
+        self._cached_hm = self._cached_hms = self._cached_date = ""
+
         # Initialization
         self.draw_casing()
+        self.build_snake_cells()
+        self.build_calc_cells()
         self.setup_bindings()
         self.reset_snake()
         
@@ -157,6 +199,47 @@ class GameboySimulator:
         c.create_rectangle(210, ss_y, 210+ss_w, ss_y+ss_h, fill=COLOR_BUTTON_SS, outline="black")
         c.create_text(235, ss_y+25, text="START", font=("Arial", 8, "bold"), fill="#303080")
 
+    def build_snake_cells(self):
+        """Pre-creates one hidden rectangle per board cell; the snake is drawn by toggling them."""
+        ox, oy = self.screen_offset_x, self.screen_offset_y
+        self.snake_cells = [[self.canvas.create_rectangle(ox + x*GRID_SIZE, oy + y*GRID_SIZE, ox + (x+1)*GRID_SIZE, oy + (y+1)*GRID_SIZE,
+                                                          fill=COLOR_GB_DARKEST, outline=COLOR_GB_LIGHT, width=1, state="hidden", tags="snake_cell")
+                             for x in range(GRID_W)] for y in range(GRID_H)]
+        self._visible_cells = set()
+
+    def build_calc_cells(self):
+        """Lays out the 16 calculator keys once; rendering only recolors the cursor cell."""
+        ox, oy = self.screen_offset_x, self.screen_offset_y
+        start_y = 45
+        w = (SCREEN_WIDTH - 10) / 4
+        h = (SCREEN_HEIGHT - 55) / 4
+        self.calc_cells = []
+        for i, btn in enumerate(self.calc_buttons):
+            r, c = divmod(i, 4)
+            bx = ox + 5 + c*w
+            by = oy + start_y + r*h
+            rect = self.canvas.create_rectangle(bx, by, bx+w-2, by+h-2, fill=COLOR_GB_LIGHT, outline=COLOR_GB_DARKEST, state="hidden", tags="calc_cell")
+            text = self.canvas.create_text(bx+w/2, by+h/2, text=btn, font=self._calc_font, fill=COLOR_GB_DARKEST, state="hidden", tags="calc_cell")
+            self.calc_cells.append((rect, text))
+        self._calc_visible = False
+        self._prev_calc_cursor = None
+
+    def set_calc_cell(self, i, selected):
+        rect, text = self.calc_cells[i]
+        self.canvas.itemconfigure(rect, fill=COLOR_GB_DARK if selected else COLOR_GB_LIGHT)
+        self.canvas.itemconfigure(text, fill="white" if selected else COLOR_GB_DARKEST)
+
+    def sync_calc_cells(self, visible):
+        if visible != self._calc_visible:
+            self.canvas.itemconfigure("calc_cell", state="normal" if visible else "hidden")
+            self._calc_visible = visible
+        if visible and self.calc_cursor != self._prev_calc_cursor:
+            # Highlight cursor
+            if self._prev_calc_cursor is not None:
+                self.set_calc_cell(self._prev_calc_cursor, False)
+            self.set_calc_cell(self.calc_cursor, True)
+            self._prev_calc_cursor = self.calc_cursor
+
     def setup_bindings(self):
         # Keyboard bindings
         self.root.bind("<KeyPress>", self.on_key_press)
@@ -168,71 +251,81 @@ class GameboySimulator:
         
         print("Controls:\nArrow Keys: D-Pad\nZ or A: A Button (Confirm)\nX or B: B Button (Back)\nEnter: Start\nShift: Select\n*You can also click the buttons with your mouse!*")
 
+    # Keyboard keysym (upper-cased) -> button bit
+    _KEYMAP = {
+        "UP": K_UP, "DOWN": K_DOWN, "LEFT": K_LEFT, "RIGHT": K_RIGHT,
+        "Z": K_A, "A": K_A,
+        "X": K_B, "BACKSPACE": K_B, "B": K_B,
+        "RETURN": K_START,
+        "SHIFT_L": K_SELECT, "SHIFT_R": K_SELECT,
+    }
+
     def on_key_press(self, event):
-        k = event.keysym.upper()
-        if k == "UP": self.keys["UP"] = True
-        elif k == "DOWN": self.keys["DOWN"] = True
-        elif k == "LEFT": self.keys["LEFT"] = True
-        elif k == "RIGHT": self.keys["RIGHT"] = True
-        elif k == "Z" or k == "A": self.keys["A"] = True
-        elif k == "X" or k == "BACKSPACE" or k == "B": self.keys["B"] = True
-        elif k == "RETURN": self.keys["START"] = True
-        elif k == "SHIFT_L" or k == "SHIFT_R": self.keys["SELECT"] = True
+        bit = self._KEYMAP.get(event.keysym.upper())
+        if bit:
+            self.keys |= bit
+            self.wake()
 
     def on_key_release(self, event):
-        k = event.keysym.upper()
-        if k == "UP": self.keys["UP"] = False
-        elif k == "DOWN": self.keys["DOWN"] = False
-        elif k == "LEFT": self.keys["LEFT"] = False
-        elif k == "RIGHT": self.keys["RIGHT"] = False
-        elif k == "Z" or k == "A": self.keys["A"] = False
-        elif k == "X" or k == "BACKSPACE" or k == "B": self.keys["B"] = False
-        elif k == "RETURN": self.keys["START"] = False
-        elif k == "SHIFT_L" or k == "SHIFT_R": self.keys["SELECT"] = False
+        bit = self._KEYMAP.get(event.keysym.upper())
+        if bit:
+            self.keys &= ~bit
+            self.wake()
+
+    # On-screen button hitboxes (x0, y0, x1, y1, name), tested in order with
+    # inclusive bounds. The D-pad deadzone comes first so its edges win over the arms.
+    _HITBOXES = (
+        (90, 458, 120, 488, None),        # D-Pad deadzone center
+        (90, 428, 120, 458, "UP"),
+        (90, 488, 120, 518, "DOWN"),
+        (60, 458, 90, 488, "LEFT"),
+        (120, 458, 150, 488, "RIGHT"),
+        (330, 468, 370, 508, "A"),        # A Button (330, 468, 40x40)
+        (280, 488, 320, 528, "B"),        # B Button (280, 488, 40x40)
+        (140, 570, 190, 585, "SELECT"),   # Select (140, 570, 50x15)
+        (210, 570, 260, 585, "START"),    # Start (210, 570, 50x15)
+    )
+    _HITBOX_BOUNDS = (
+        min(b[0] for b in _HITBOXES), min(b[1] for b in _HITBOXES),
+        max(b[2] for b in _HITBOXES), max(b[3] for b in _HITBOXES),
+    )
 
     def get_button_at_pos(self, x, y):
         """Hitbox detection for on-screen buttons."""
-        # D-Pad (Center around 90, 458)
-        if 90 <= x <= 120 and 428 <= y < 458: return "UP"
-        if 90 <= x <= 120 and 488 < y <= 518: return "DOWN"
-        if 60 <= x < 90 and 458 <= y <= 488: return "LEFT"
-        if 120 < x <= 150 and 458 <= y <= 488: return "RIGHT"
-        if 90 <= x <= 120 and 458 <= y <= 488: return None # Deadzone center
-        
-        # A Button (330, 468, 40x40)
-        if 330 <= x <= 370 and 468 <= y <= 508: return "A"
-        
-        # B Button (280, 488, 40x40)
-        if 280 <= x <= 320 and 488 <= y <= 528: return "B"
-        
-        # Select (140, 570, 50x15)
-        if 140 <= x <= 190 and 570 <= y <= 585: return "SELECT"
-        
-        # Start (210, 570, 50x15)
-        if 210 <= x <= 260 and 570 <= y <= 585: return "START"
-        
+        bx0, by0, bx1, by1 = self._HITBOX_BOUNDS
+        if not (bx0 <= x <= bx1 and by0 <= y <= by1):
+            return None # Outside the control cluster
+        for x0, y0, x1, y1, name in self._HITBOXES:
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                return name
         return None
 
     def on_mouse_down(self, event):
         btn = self.get_button_at_pos(event.x, event.y)
         if btn:
-            self.keys[btn] = True
+            self.keys |= BUTTON_BITS[btn]
             self.mouse_pressed_btn = btn
+            self.wake()
 
     def on_mouse_up(self, event):
         if self.mouse_pressed_btn:
-            self.keys[self.mouse_pressed_btn] = False
+            self.keys &= ~BUTTON_BITS[self.mouse_pressed_btn]
             self.mouse_pressed_btn = None
+            self.wake()
 
-    def is_pressed(self, key):
-        return self.keys[key] and not self.prev_keys[key]
+    def is_pressed(self, mask):
+        return bool(self.pressed & mask)
 
     def beep(self):
         self.root.bell()
 
     # --- Snake Logic ---
     def reset_snake(self):
-        self.snake = [(5, 5), (4, 5), (3, 5)]
+        self.snake = deque([(5, 5), (4, 5), (3, 5)])
+        self.snake_set = set(self.snake)
+        # Empty cells as a list plus cell -> index, so food can be drawn in O(1)
+        self._free_list = [(x, y) for y in range(GRID_H) for x in range(GRID_W) if (x, y) not in self.snake_set]
+        self._free_pos = {cell: i for i, cell in enumerate(self._free_list)}
         self.direction = (1, 0)
         self.next_direction = (1, 0)
         self.game_over = False
@@ -240,15 +333,25 @@ class GameboySimulator:
         self.spawn_food()
         self.game_running = False
 
+    def free_cell(self, cell):
+        self._free_pos[cell] = len(self._free_list)
+        self._free_list.append(cell)
+
+    def take_cell(self, cell):
+        # Swap-remove: move the last entry into the vacated slot
+        idx = self._free_pos.pop(cell)
+        last = self._free_list.pop()
+        if idx < len(self._free_list):
+            self._free_list[idx] = last
+            self._free_pos[last] = idx
+
     def spawn_food(self):
-        while True:
-            x = random.randint(0, GRID_W - 1)
-            y = random.randint(0, GRID_H - 1)
-            if (x, y) not in self.snake:
-                self.food = (x, y)
-                break
+        self.food = random.choice(self._free_list) if self._free_list else None
 
     def update_snake_logic(self):
+        # Deliberately plain Python: the body is a few dozen cells and each
+        # step is O(1) via snake_set/_free_list, so a JIT (numba etc.) would
+        # cost more in warmup than it saves. Frame time here is Tk drawing.
         if not self.game_running or self.game_over: return
         
         self.direction = self.next_direction
@@ -256,33 +359,44 @@ class GameboySimulator:
         dx, dy = self.direction
         nx, ny = hx + dx, hy + dy
 
-        if nx < 0 or nx >= GRID_W or ny < 0 or ny >= GRID_H or (nx, ny) in self.snake:
+        self.dirty = True
+        if nx < 0 or nx >= GRID_W or ny < 0 or ny >= GRID_H or (nx, ny) in self.snake_set:
             self.game_over = True
             self.beep()
             return
 
-        self.snake.insert(0, (nx, ny))
+        self.snake.appendleft((nx, ny))
+        self.snake_set.add((nx, ny))
+        self.take_cell((nx, ny))
         if (nx, ny) == self.food:
             self.score += 10
             self.beep()
             self.spawn_food()
         else:
-            self.snake.pop()
+            tail = self.snake.pop()
+            self.snake_set.discard(tail)
+            self.free_cell(tail)
 
     # --- Input Handling ---
     def handle_input(self):
-        if self.is_pressed("START"):
+        # Every screen change driven by input starts with a key transition
+        changed = self.keys ^ self.prev_keys
+        self.pressed = changed & self.keys
+        if changed:
+            self.dirty = True
+
+        if self.is_pressed(K_START):
             # Universal "Home" button
             self.current_state = STATE_MENU
             self.beep()
             return
 
         if self.current_state == STATE_MENU:
-            if self.is_pressed("UP"):
-                self.menu_index = (self.menu_index - 1) % len(self.menu_items)
-            elif self.is_pressed("DOWN"):
-                self.menu_index = (self.menu_index + 1) % len(self.menu_items)
-            elif self.is_pressed("A"):
+            if self.is_pressed(K_UP):
+                self.menu_index = (self.menu_index - 1) % self._menu_len
+            elif self.is_pressed(K_DOWN):
+                self.menu_index = (self.menu_index + 1) % self._menu_len
+            elif self.is_pressed(K_A):
                 self.beep()
                 selected = self.menu_items[self.menu_index]
                 if selected == "SNAKE":
@@ -297,46 +411,47 @@ class GameboySimulator:
 
         elif self.current_state == STATE_SNAKE:
             # Game Start
-            if not self.game_running and self.is_pressed("A"):
-                self.game_running = True
-                self.game_over = False
+            if not self.game_running and self.is_pressed(K_A):
                 self.reset_snake()
                 self.game_running = True
             
             # Direction
             dx, dy = self.direction
-            if self.keys["UP"] and dy == 0: self.next_direction = (0, -1)
-            elif self.keys["DOWN"] and dy == 0: self.next_direction = (0, 1)
-            elif self.keys["LEFT"] and dx == 0: self.next_direction = (-1, 0)
-            elif self.keys["RIGHT"] and dx == 0: self.next_direction = (1, 0)
+            if self.keys & K_UP and dy == 0: self.next_direction = (0, -1)
+            elif self.keys & K_DOWN and dy == 0: self.next_direction = (0, 1)
+            elif self.keys & K_LEFT and dx == 0: self.next_direction = (-1, 0)
+            elif self.keys & K_RIGHT and dx == 0: self.next_direction = (1, 0)
 
         elif self.current_state == STATE_CLOCK:
-            if self.is_pressed("B"):
+            if self.is_pressed(K_B):
                 self.current_state = STATE_MENU
 
         elif self.current_state == STATE_NOTES:
             # Typewriter style: Up/Down cycles char, A writes, B deletes
-            if self.is_pressed("UP"):
-                self.note_char_idx = (self.note_char_idx + 1) % len(self.CHAR_SET)
-            elif self.is_pressed("DOWN"):
-                self.note_char_idx = (self.note_char_idx - 1) % len(self.CHAR_SET)
-            elif self.is_pressed("A"): # Add char
-                self.note_content += self.CHAR_SET[self.note_char_idx]
+            if self.is_pressed(K_UP):
+                self.note_char_idx = (self.note_char_idx + 1) % self._charset_len
+            elif self.is_pressed(K_DOWN):
+                self.note_char_idx = (self.note_char_idx - 1) % self._charset_len
+            elif self.is_pressed(K_A): # Add char
+                self._note_chars.append(self.CHAR_SET[self.note_char_idx])
+                self._notes_dirty = True
                 self.beep()
-            elif self.is_pressed("B"): # Backspace
-                self.note_content = self.note_content[:-1]
+            elif self.is_pressed(K_B): # Backspace
+                if self._note_chars:
+                    self._note_chars.pop()
+                self._notes_dirty = True
                 self.beep()
 
         elif self.current_state == STATE_CALC:
             # Grid Navigation
             r, c = divmod(self.calc_cursor, 4)
-            if self.is_pressed("RIGHT"): c = (c + 1) % 4
-            elif self.is_pressed("LEFT"): c = (c - 1) % 4
-            elif self.is_pressed("UP"): r = (r - 1) % 4
-            elif self.is_pressed("DOWN"): r = (r + 1) % 4
+            if self.is_pressed(K_RIGHT): c = (c + 1) % 4
+            elif self.is_pressed(K_LEFT): c = (c - 1) % 4
+            elif self.is_pressed(K_UP): r = (r - 1) % 4
+            elif self.is_pressed(K_DOWN): r = (r + 1) % 4
             self.calc_cursor = r * 4 + c
             
-            if self.is_pressed("A"):
+            if self.is_pressed(K_A):
                 self.beep()
                 char = self.calc_buttons[self.calc_cursor]
                 if char in "0123456789":
@@ -365,113 +480,184 @@ class GameboySimulator:
                         elif self.calc_op == "/": 
                             res = self.calc_left_op / right if right != 0 else 0
                         
-                        # Format result
-                        if res.is_integer():
-                            self.calc_val = str(int(res))
-                        else:
-                            self.calc_val = str(round(res, 5))
+                        # Format result: up to 5 decimals, trailing zeros dropped
+                        if not math.isfinite(res):
+                            res = 0
+                        s = f"{res:.5f}".rstrip('0').rstrip('.')
+                        self.calc_val = "0" if s in ("", "-0") else s
                         self.calc_op = None
                         self.calc_new_entry = True
 
     # --- Rendering ---
     def render_screen(self):
-        self.canvas.delete("game_obj")
+        if not self.dirty:
+            return
+        # Leaving a state hides all of its items with one tag-wide call
+        left_state = None
+        if self.current_state != self._prev_state:
+            if self._prev_state is not None:
+                left_state = self._prev_state
+                self._shown = {key for key in self._shown if key[0] != left_state}
+            self._prev_state = self.current_state
+
+        # Retained mode: items persist between frames; whatever this frame
+        # doesn't draw is hidden instead of deleted
+        self._frame_items = set()
+        self._board_visible = False
+        self._pending_config = []
+        self._pending_coords = []
+        self.draw_screen_contents()
+
+        # Push the whole frame to Tk in one contiguous block, every
+        # itemconfigure before any coords, with no geometry queries in between
+        c = self.canvas
+        if left_state is not None:
+            c.itemconfigure("state_" + left_state, state="hidden")
+        for item, opts in self._pending_config:
+            c.itemconfigure(item, **opts)
+        for key in self._shown - self._frame_items:
+            c.itemconfigure(self.items[key], state="hidden")
+        self.sync_snake_cells(self.snake_set if self._board_visible else ())
+        self.sync_calc_cells(self.current_state == STATE_CALC)
+        for item, coords in self._pending_coords:
+            c.coords(item, *coords)
+        self._shown = self._frame_items
+        self.dirty = False
+
+    def draw_screen_contents(self):
         ox, oy = self.screen_offset_x, self.screen_offset_y
 
         # Global Status Bar (Time)
-        now = datetime.datetime.now().strftime("%H:%M")
-        self.draw_pixel_text(now, ox + SCREEN_WIDTH - 50, oy + SCREEN_HEIGHT - 15, 1)
+        self.draw_pixel_text(("STATUS", "time"), self._cached_hm, ox + SCREEN_WIDTH - 50, oy + SCREEN_HEIGHT - 15, 1)
 
         if self.current_state == STATE_MENU:
-            self.draw_pixel_text("- MAIN MENU -", ox + 10, oy + 10, 2)
+            self.draw_pixel_text((STATE_MENU, "title"), "- MAIN MENU -", ox + 10, oy + 10, 2)
             for i, item in enumerate(self.menu_items):
                 prefix = "> " if i == self.menu_index else "  "
-                self.draw_pixel_text(prefix + item, ox + 20, oy + 40 + (i*20), 2)
-            self.draw_pixel_text("A: SELECT", ox + 10, oy + SCREEN_HEIGHT - 30, 1)
+                self.draw_pixel_text((STATE_MENU, "item", i), prefix + item, ox + 20, oy + 40 + (i*20), 2)
+            self.draw_pixel_text((STATE_MENU, "hint"), "A: SELECT", ox + 10, oy + SCREEN_HEIGHT - 30, 1)
 
         elif self.current_state == STATE_SNAKE:
             if not self.game_running:
-                self.draw_pixel_text("SNAKE", ox + 40, oy + 40, 4)
-                self.draw_pixel_text("PRESS A", ox + 40, oy + 80, 2)
+                self.draw_pixel_text((STATE_SNAKE, "title"), "SNAKE", ox + 40, oy + 40, 4)
+                self.draw_pixel_text((STATE_SNAKE, "prompt"), "PRESS A", ox + 40, oy + 80, 2)
                 return
             if self.game_over:
-                self.draw_pixel_text("GAME OVER", ox + 30, oy + 40, 3)
-                self.draw_pixel_text(f"SCORE: {self.score}", ox + 40, oy + 80, 2)
+                self.draw_pixel_text((STATE_SNAKE, "over"), "GAME OVER", ox + 30, oy + 40, 3)
+                self.draw_pixel_text((STATE_SNAKE, "final"), f"SCORE: {self.score}", ox + 40, oy + 80, 2)
                 return
             
             # Draw Snake Game
-            fx, fy = self.food
-            self.canvas.create_oval(ox + fx*GRID_SIZE, oy + fy*GRID_SIZE, ox + (fx+1)*GRID_SIZE, oy + (fy+1)*GRID_SIZE, fill=COLOR_GB_DARKEST, tags="game_obj")
-            for x, y in self.snake:
-                self.canvas.create_rectangle(ox + x*GRID_SIZE, oy + y*GRID_SIZE, ox + (x+1)*GRID_SIZE, oy + (y+1)*GRID_SIZE, fill=COLOR_GB_DARKEST, outline=COLOR_GB_LIGHT, width=1, tags="game_obj")
-            self.draw_pixel_text(str(self.score), ox+5, oy+5, 1)
+            if self.food is not None:
+                fx, fy = self.food
+                self.draw_item((STATE_SNAKE, "food"), "oval", (ox + fx*GRID_SIZE, oy + fy*GRID_SIZE, ox + (fx+1)*GRID_SIZE, oy + (fy+1)*GRID_SIZE), fill=COLOR_GB_DARKEST)
+            self._board_visible = True
+            self.draw_pixel_text((STATE_SNAKE, "score"), str(self.score), ox+5, oy+5, 1)
 
         elif self.current_state == STATE_CLOCK:
-            full_time = datetime.datetime.now().strftime("%H:%M:%S")
-            date_str = datetime.datetime.now().strftime("%Y-%m-%d")
-            self.draw_pixel_text("CLOCK", ox + 50, oy + 10, 2)
-            self.draw_pixel_text(full_time, ox + 10, oy + 50, 4)
-            self.draw_pixel_text(date_str, ox + 20, oy + 90, 2)
-            self.draw_pixel_text("B: BACK", ox + 10, oy + SCREEN_HEIGHT - 30, 1)
+            self.draw_pixel_text((STATE_CLOCK, "title"), "CLOCK", ox + 50, oy + 10, 2)
+            self.draw_pixel_text((STATE_CLOCK, "time"), self._cached_hms, ox + 10, oy + 50, 4)
+            self.draw_pixel_text((STATE_CLOCK, "date"), self._cached_date, ox + 20, oy + 90, 2)
+            self.draw_pixel_text((STATE_CLOCK, "hint"), "B: BACK", ox + 10, oy + SCREEN_HEIGHT - 30, 1)
 
         elif self.current_state == STATE_NOTES:
-            self.draw_pixel_text("NOTEPAD", ox + 40, oy + 5, 2)
+            self.draw_pixel_text((STATE_NOTES, "title"), "NOTEPAD", ox + 40, oy + 5, 2)
             # Draw content (simple wrap)
-            lines = [self.note_content[i:i+18] for i in range(0, len(self.note_content), 18)]
-            for i, line in enumerate(lines[-6:]): # Show last 6 lines
-                self.draw_pixel_text(line, ox + 5, oy + 30 + (i*15), 2)
+            if self._notes_dirty:
+                self.note_content = "".join(self._note_chars)
+                lines = [self.note_content[i:i+18] for i in range(0, len(self.note_content), 18)]
+                self._note_lines = lines[-6:] # Show last 6 lines
+                self._notes_dirty = False
+            for i, line in enumerate(self._note_lines):
+                self.draw_pixel_text((STATE_NOTES, "line", i), line, ox + 5, oy + 30 + (i*15), 2)
             
             # Draw "Keyboard" area
             char = self.CHAR_SET[self.note_char_idx]
-            self.draw_pixel_text(f"TYPE: [{char}]", ox + 5, oy + SCREEN_HEIGHT - 40, 2)
-            self.draw_pixel_text("A:Add B:Del ^v:Chr", ox + 5, oy + SCREEN_HEIGHT - 20, 1)
+            self.draw_pixel_text((STATE_NOTES, "type"), f"TYPE: [{char}]", ox + 5, oy + SCREEN_HEIGHT - 40, 2)
+            self.draw_pixel_text((STATE_NOTES, "hint"), "A:Add B:Del ^v:Chr", ox + 5, oy + SCREEN_HEIGHT - 20, 1)
 
         elif self.current_state == STATE_CALC:
             # Display
-            self.canvas.create_rectangle(ox+5, oy+5, ox+SCREEN_WIDTH-5, oy+35, fill=COLOR_GB_LIGHT, outline=COLOR_GB_DARKEST, tags="game_obj")
-            self.draw_pixel_text(self.calc_val[-10:], ox+10, oy+10, 3) # Right align approx
-            
-            # Grid
-            start_y = 45
-            w = (SCREEN_WIDTH - 10) / 4
-            h = (SCREEN_HEIGHT - 55) / 4
-            for i, btn in enumerate(self.calc_buttons):
-                r, c = divmod(i, 4)
-                bx = ox + 5 + c*w
-                by = oy + start_y + r*h
-                
-                # Highlight cursor
-                fill = COLOR_GB_DARK if i == self.calc_cursor else COLOR_GB_LIGHT
-                text_col = "white" if i == self.calc_cursor else COLOR_GB_DARKEST
-                
-                self.canvas.create_rectangle(bx, by, bx+w-2, by+h-2, fill=fill, outline=COLOR_GB_DARKEST, tags="game_obj")
-                self.canvas.create_text(bx+w/2, by+h/2, text=btn, font=("Courier", 12, "bold"), fill=text_col, tags="game_obj")
-
-    def draw_pixel_text(self, text, x, y, size):
-        self.canvas.create_text(x, y, text=text, anchor="nw", font=("Courier", int(size*5), "bold"), fill=COLOR_GB_DARKEST, tags="game_obj")
+            self.draw_item((STATE_CALC, "display"), "rectangle", (ox+5, oy+5, ox+SCREEN_WIDTH-5, oy+35), fill=COLOR_GB_LIGHT, outline=COLOR_GB_DARKEST)
+            self.draw_pixel_text((STATE_CALC, "value"), self.calc_val[-10:], ox+10, oy+10, 3) # Right align approx
+            # The key grid itself is pre-built; see sync_calc_cells()
+
+    def sync_snake_cells(self, cells):
+        # Show/hide only the board cells whose occupancy changed
+        new_visible = set(cells)
+        for x, y in self._visible_cells - new_visible:
+            self.canvas.itemconfigure(self.snake_cells[y][x], state="hidden")
+        for x, y in new_visible - self._visible_cells:
+            self.canvas.itemconfigure(self.snake_cells[y][x], state="normal")
+        self._visible_cells = new_visible
+
+    def draw_item(self, key, kind, coords, **opts):
+        """Creates the canvas item for key once, then only queues what changed."""
+        item = self.items.get(key)
+        if item is None:
+            create = getattr(self.canvas, "create_" + kind)
+            self.items[key] = create(*coords, tags="state_" + key[0], **opts)
+            self._shown.add(key)
+        else:
+            old_coords, old_opts = self._item_state[key]
+            if coords != old_coords:
+                self._pending_coords.append((item, coords))
+            changed = {k: v for k, v in opts.items() if old_opts.get(k) != v}
+            if key not in self._shown:
+                changed["state"] = "normal"
+            if changed:
+                self._pending_config.append((item, changed))
+        self._item_state[key] = (coords, opts)
+        self._frame_items.add(key)
+
+    def draw_pixel_text(self, key, text, x, y, size):
+        self.draw_item(key, "text", (x, y), text=text, anchor="nw", font=self._fonts[size], fill=COLOR_GB_DARKEST)
 
     def game_loop(self):
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Update Keys (Store previous frame for single-press detection)
         self.handle_input()
-        self.prev_keys = self.keys.copy()
+        self.prev_keys = self.keys
 
         # Game Logic
         self.speed_counter += 1
         threshold = self.update_rate
-        if self.keys["A"]: threshold //= 2
+        if self.keys & K_A: threshold //= 2
         
         if self.current_state == STATE_SNAKE and self.speed_counter >= threshold:
             self.update_snake_logic()
             self.speed_counter = 0
 
+        # Status bar / clock face tick over once per second
+        now_sec = int(time.time())
+        if now_sec != self._last_now_sec:
+            now = datetime.datetime.now()
+            self._cached_hm = now.strftime("%H:%M")
+            self._cached_hms = now.strftime("%H:%M:%S")
+            self._cached_date = now.strftime("%Y-%m-%d")
+            self._last_now_sec = now_sec
+            self.dirty = True
+
         self.render_screen()
 
-        elapsed = (time.time() - start_time) * 1000
-        wait = int(FRAME_DELAY - elapsed)
-        if wait < 1: wait = 1
-        self.root.after(wait, self.game_loop)
+        # Only a running snake game animates; everything else sleeps until the
+        # status bar's next second (input wakes the loop early)
+        self._idle = not (self.current_state == STATE_SNAKE and self.game_running and not self.game_over)
+        if self._idle:
+            wait = 1001 - int((time.time() % 1) * 1000)
+        else:
+            elapsed = (time.perf_counter() - start_time) * 1000
+            wait = int(FRAME_DELAY - elapsed)
+            if wait < 1: wait = 1
+        self._after_id = self.root.after(wait, self.game_loop)
+
+    def wake(self):
+        # Run the loop right away instead of waiting out an idle sleep
+        if self._idle:
+            self._idle = False
+            self.root.after_cancel(self._after_id)
+            self._after_id = self.root.after_idle(self.game_loop)
 
 if __name__ == "__main__":
     root = tk.Tk()
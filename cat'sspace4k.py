@@ -1,11 +1,19 @@
 import pygame
 import random
-import array
 import math
+import queue
+import threading
+from collections import OrderedDict
+import numpy as np
 
 # --- CONFIGURATION ---
 WIDTH, HEIGHT = 600, 400
 FPS = 60
+ALIEN_SIZE = 24
+BULLET_W, BULLET_H = 3, 8
+HUD_RECT = pygame.Rect(0, 0, WIDTH, 50)  # Score/lives band, repainted every frame
+FIRE_ROLL_BATCH = 256  # Frames of alien fire decisions rolled at once
+TEXT_CACHE_SIZE = 128  # Rendered strings kept; least recently used go first
 
 # Famicom/NES Inspired Palette
 CLR_BG = (0, 0, 0)                  # Pure Black
@@ -18,89 +26,117 @@ CLR_UI_TEXT = (255, 255, 255)      # White
 CLR_UI_ACCENT = (200, 200, 255)    # Light blue accent
 
 # --- GBA SFX SYNTHESIZER ---
+EXPLODE_VARIANTS = 6  # Pre-rendered noise takes; more is indistinguishable
+RUMBLE_LUT_LEN = 2205  # Whole number of 80Hz rumble periods at 44.1kHz
+
 class GbaSfx:
     def __init__(self):
         try:
-            pygame.mixer.init(frequency=44100, size=-16, channels=2)
+            # 2048-sample buffer (~46ms) rides out scheduling hiccups without
+            # underruns; extra channels let overlapping explosions all sound
+            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
+            pygame.mixer.set_num_channels(16)
             self.enabled = True
         except:
             print("Audio initialization failed. Running without sound.")
             self.enabled = False
 
-    def _play_buf(self, buf):
-        if not self.enabled: 
-            return
-        try:
-            # Convert to stereo for better compatibility
-            stereo_buf = array.array('h')
-            for i in range(0, len(buf), 1):
-                # Duplicate mono to stereo channels
-                stereo_buf.append(buf[i])
-                stereo_buf.append(buf[i])
-            
-            sound = pygame.mixer.Sound(buffer=bytes(stereo_buf))
-            sound.set_volume(0.3)
-            sound.play()
-        except Exception as e:
-            print(f"Sound playback error: {e}")
-
-    def play_shoot(self):
-        buf = array.array('h')
+        self._rng = np.random.default_rng()
+        # One 80Hz rumble loop for the explosions: 44100 / 80 is not a whole
+        # number of samples but four periods are exactly 2205
+        self._rumble_lut = 4000 * np.sin(2 * math.pi * np.arange(RUMBLE_LUT_LEN) / (44100 / 80))
+
+        # The effects are deterministic (bar the noise), so synthesize them
+        # once here and only trigger playback during the game
+        if self.enabled:
+            try:
+                self._shoot = self._make_shoot()
+                self._select = self._make_select()
+                self._explode_pool = [self._make_explode() for _ in range(EXPLODE_VARIANTS)]
+            except Exception as e:
+                print(f"Sound synthesis error: {e}")
+                self.enabled = False
+
+        # Playback calls go through a daemon thread so the mixer lock is
+        # never taken inside the frame
+        if self.enabled:
+            self._queue = queue.Queue()
+            threading.Thread(target=self._worker, daemon=True).start()
+
+    def _make_sound(self, buf):
+        # Convert to stereo for better compatibility: interleave L/R copies
+        stereo_buf = np.column_stack((buf, buf)).ravel()
+        sound = pygame.mixer.Sound(buffer=stereo_buf.tobytes())
+        sound.set_volume(0.3)
+        return sound
+
+    def _worker(self):
+        while True:
+            sound = self._queue.get()
+            try:
+                sound.play()
+            except Exception as e:
+                print(f"Sound playback error: {e}")
+
+    def _play(self, sound):
+        if self.enabled:
+            self._queue.put(sound)
+
+    def _make_shoot(self):
         duration = 0.05  # 50ms
         samples = int(44100 * duration)
-        
-        for i in range(samples):
-            # Square wave with decreasing frequency
-            freq = 1000 - (i / samples * 600)
-            period = 44100 / max(100, freq)  # Avoid division by zero
-            val = 3000 if (i // (period / 2)) % 2 else -3000
-            
-            # Add envelope
-            env = 1.0 - (i / samples)
-            buf.append(int(val * env))
-        self._play_buf(buf)
+        i = np.arange(samples, dtype=np.float64)
 
-    def play_explode(self):
-        buf = array.array('h')
+        # Square wave with decreasing frequency
+        freq = 1000 - (i / samples * 600)
+        period = 44100 / np.maximum(100, freq)  # Avoid division by zero
+        val = np.where((i // (period / 2)) % 2, 3000, -3000)
+
+        # Add envelope
+        env = 1.0 - (i / samples)
+        return self._make_sound((val * env).astype(np.int16))
+
+    def _make_explode(self):
         duration = 0.2  # 200ms
         samples = int(44100 * duration)
-        
-        for i in range(samples):
-            # Noise explosion with envelope
-            env = 1.0 - (i / samples) ** 2  # Quadratic envelope
-            noise = random.randint(-8000, 8000)
-            
-            # Add some low frequency rumble
-            rumble_freq = 80
-            rumble_period = 44100 / rumble_freq
-            rumble = 4000 * math.sin(2 * math.pi * i / rumble_period)
-            
-            val = int((noise * 0.7 + rumble * 0.3) * env)
-            buf.append(val)
-        self._play_buf(buf)
+        i = np.arange(samples, dtype=np.float64)
 
-    def play_select(self):
-        buf = array.array('h')
+        # Noise explosion with envelope
+        env = 1.0 - (i / samples) ** 2  # Quadratic envelope
+        noise = self._rng.integers(-8000, 8001, size=samples, dtype=np.int16)
+
+        # Add some low frequency rumble
+        rumble = self._rumble_lut[np.arange(samples) % RUMBLE_LUT_LEN]
+
+        return self._make_sound(((noise * 0.7 + rumble * 0.3) * env).astype(np.int16))
+
+    def _make_select(self):
         duration = 0.08  # 80ms
         samples = int(44100 * duration)
-        
-        for i in range(samples):
-            # Rising square wave
-            freq = 300 + (i / samples * 300)
-            period = 44100 / max(100, freq)
-            val = 4000 if (i // (period / 2)) % 2 else -4000
-            
-            # Quick attack, slow release envelope
-            if i < samples * 0.1:
-                env = i / (samples * 0.1)  # Attack
-            else:
-                env = 1.0 - ((i - samples * 0.1) / (samples * 0.9))  # Release
-                
-            buf.append(int(val * env))
-        self._play_buf(buf)
+        i = np.arange(samples, dtype=np.float64)
+
+        # Rising square wave
+        freq = 300 + (i / samples * 300)
+        period = 44100 / np.maximum(100, freq)
+        val = np.where((i // (period / 2)) % 2, 4000, -4000)
+
+        # Quick attack, slow release envelope
+        attack = samples * 0.1
+        env = np.where(i < attack, i / attack, 1.0 - ((i - attack) / (samples * 0.9)))
+        return self._make_sound((val * env).astype(np.int16))
+
+    def play_shoot(self):
+        self._play(self._shoot)
+
+    def play_explode(self):
+        if self.enabled:
+            self._play(random.choice(self._explode_pool))
+
+    def play_select(self):
+        self._play(self._select)
 
 # --- SPRITES ---
-class Player(pygame.sprite.Sprite):
+class Player(pygame.sprite.DirtySprite):
     def __init__(self):
         super().__init__()
         self.image = pygame.Surface((32, 24), pygame.SRCALPHA)
@@ -109,12 +145,15 @@ class Player(pygame.sprite.Sprite):
         pygame.draw.rect(self.image, CLR_PLAYER, (4, 8, 24, 8))
         pygame.draw.rect(self.image, (255, 255, 255), (8, 10, 16, 4))
         pygame.draw.rect(self.image, CLR_PLAYER, (0, 16, 32, 8))
+        self.image = self.image.convert_alpha()  # Match the display for fast blits
         self.rect = self.image.get_rect(midbottom=(WIDTH//2, HEIGHT-20))
         self.speed = 5
         self.shoot_cooldown = 0
 
     def update(self, *args, **kwargs):
-        keys = pygame.key.get_pressed()
+        keys = kwargs.get("keys")
+        if keys is None:
+            keys = pygame.key.get_pressed()
         
         # Movement
         move_x = 0
@@ -123,13 +162,15 @@ class Player(pygame.sprite.Sprite):
         if keys[pygame.K_RIGHT] and self.rect.right < WIDTH:
             move_x += self.speed
             
-        self.rect.x += move_x
+        if move_x:
+            self.rect.x += move_x
+            self.dirty = 1
         
         # Update cooldown
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
 
-class Alien(pygame.sprite.Sprite):
+class Alien(pygame.sprite.DirtySprite):
     def __init__(self, x, y, row):
         super().__init__()
         self.row = row
@@ -144,7 +185,7 @@ class Alien(pygame.sprite.Sprite):
     def _create_frames(self):
         frames = []
         for frame in range(2):
-            surf = pygame.Surface((24, 24), pygame.SRCALPHA)
+            surf = pygame.Surface((ALIEN_SIZE, ALIEN_SIZE), pygame.SRCALPHA)
             # Alien body
             pygame.draw.rect(surf, self.color, (4, 4, 16, 12))
             # Eyes
@@ -154,7 +195,7 @@ class Alien(pygame.sprite.Sprite):
             leg_y = 16 if frame == 0 else 18
             pygame.draw.rect(surf, self.color, (4, leg_y, 4, 4))
             pygame.draw.rect(surf, self.color, (16, leg_y, 4, 4))
-            frames.append(surf)
+            frames.append(surf.convert_alpha())
         return frames
 
     def update(self, *args, **kwargs):
@@ -164,19 +205,7 @@ class Alien(pygame.sprite.Sprite):
             self.animation_timer = 0
             self.frame_idx = (self.frame_idx + 1) % 2
             self.image = self.frames[self.frame_idx]
-
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, speed, color):
-        super().__init__()
-        self.image = pygame.Surface((3, 8))
-        self.image.fill(color)
-        self.rect = self.image.get_rect(centerx=x, bottom=y)
-        self.speed = speed
-
-    def update(self, *args, **kwargs):
-        self.rect.y += self.speed
-        if self.rect.bottom < 0 or self.rect.top > HEIGHT:
-            self.kill()
+            self.dirty = 1
 
 # --- ENGINE ---
 class Game:
@@ -195,6 +224,21 @@ class Game:
             self.font_main = pygame.font.Font(None, 24)
             self.font_title = pygame.font.Font(None, 48)
 
+        # HUD numbers are composed from pre-rendered digits behind a fixed label
+        self._digit_glyphs = [self.font_main.render(str(d), True, CLR_UI_TEXT).convert_alpha() for d in range(10)]
+        self._digit_w = max(g.get_width() for g in self._digit_glyphs)
+        self._score_label = self.font_main.render("SCORE: ", True, CLR_UI_TEXT).convert_alpha()
+        self._lives_label = self.font_main.render("LIVES: ", True, CLR_UI_TEXT).convert_alpha()
+
+        # Bullets are plain table rows, all sharing one image per side
+        self._pbullet_surf = pygame.Surface((BULLET_W, BULLET_H))
+        self._pbullet_surf.fill(CLR_PLAYER)
+        self._pbullet_surf = self._pbullet_surf.convert()
+        self._ebullet_surf = pygame.Surface((BULLET_W, BULLET_H))
+        self._ebullet_surf.fill(CLR_ENEMY_BULLET)
+        self._ebullet_surf = self._ebullet_surf.convert()
+        self._bullet_rects = []  # Where bullets were blitted last frame
+
         # Create starfield background
         self.bg = pygame.Surface((WIDTH, HEIGHT))
         self.bg.fill(CLR_BG)
@@ -204,6 +248,7 @@ class Game:
             size = random.randint(1, 2)
             bright = random.choice([96, 128, 160, 192])
             pygame.draw.circle(self.bg, (bright, bright, bright), (x, y), size)
+        self.bg = self.bg.convert()
 
         self.state = "MENU"
         self.menu_idx = 0
@@ -211,13 +256,45 @@ class Game:
         self.score = 0
         self.lives = 3
         self.running = True
+        self._drawn_state = None  # State shown on screen by the last draw()
+        self._drawn_menu_idx = None
+        self._rng = np.random.default_rng()
+        self._text_cache = OrderedDict()  # (text, font, color) -> rendered Surface
+        self._build_state_backgrounds()
         self.reset_level()
 
+    def _build_state_backgrounds(self):
+        # Everything static about a screen is drawn once onto a copy of the
+        # starfield; draw() then starts those states with a single blit
+        menu = self.bg.copy()
+        self.draw_text("Cat's! Space invaders", self.font_title, CLR_ALIEN_H, WIDTH//2, 80, surface=menu)
+        self.draw_text("Use UP/DOWN to navigate, ENTER to select", self.font_main, CLR_UI_ACCENT, WIDTH//2, HEIGHT - 40, surface=menu)
+
+        instructions = ["LEFT/RIGHT ARROWS - Move ship", "SPACEBAR - Fire laser", "Destroy all alien invaders!", "", "Aliens move faster as there", "are fewer of them.", "", "Avoid enemy fire and prevent", "aliens from reaching the bottom."]
+        credits = ["Game Design & Programming:", "AC Computing Gaming Division", "", "Sound Design:", "GBA Style SFX Synthesizer", "", "Special Thanks:", "Space Invaders (1978)", "Famicom/NES Developers", "", "[C] 1999-2026"]
+        about_text = ["Cat's! Space invaders", "", "A retro-style space shooter", "inspired by classic arcade", "games from the Famicom/NES era.", "", "Features authentic 8-bit style", "graphics and GBA-inspired", "sound effects.", "", "Created with PyGame"]
+        self._state_bgs = {
+            "MENU": menu,
+            "HOW_TO_PLAY": self._render_page("HOW TO PLAY", CLR_ALIEN_M, instructions),
+            "CREDITS": self._render_page("CREDITS", CLR_ALIEN_M, credits),
+            "ABOUT": self._render_page("ABOUT", CLR_ALIEN__L, about_text),
+        }
+
+    def _render_page(self, title, title_color, lines):
+        page = self.bg.copy()
+        self.draw_text(title, self.font_title, title_color, WIDTH//2, 60, surface=page)
+        for i, line in enumerate(lines):
+            self.draw_text(line, self.font_main, CLR_UI_TEXT, WIDTH//2, 120 + i * 25, surface=page)
+        self.draw_text("PRESS ENTER TO RETURN", self.font_main, CLR_UI_ACCENT, WIDTH//2, HEIGHT - 40, surface=page)
+        return page
+
     def reset_level(self):
-        self.all_sprites = pygame.sprite.Group()
+        # LayeredDirty only repaints sprites flagged dirty (moved or animated)
+        # plus whatever overlaps them; a fresh group needs one full redraw
+        self.all_sprites = pygame.sprite.LayeredDirty()
+        self._full_redraw = True
         self.aliens = pygame.sprite.Group()
-        self.player_bullets = pygame.sprite.Group()
-        self.enemy_bullets = pygame.sprite.Group()
+        self._clear_bullets()
 
         self.player = Player()
         self.all_sprites.add(self.player)
@@ -229,85 +306,181 @@ class Game:
                 self.aliens.add(a)
                 self.all_sprites.add(a)
 
+        # Formation positions as one (N, 2) array, row i belonging to
+        # _alien_sprites[i]; moved in bulk and written back to the rects
+        self._alien_sprites = self.aliens.sprites()
+        self._alien_xy = np.array([a.rect.topleft for a in self._alien_sprites], dtype=np.int32)
+        self._alien_points = np.array([a.points for a in self._alien_sprites], dtype=np.int32)
+
         self.alien_dir = 1
         self.alien_move_timer = 0
         self.alien_move_delay = 30 
         self.alien_fire_chance = 0.01
-
-    def draw_text(self, text, font, color, x, y, center=True):
-        surf = font.render(text, True, color)
+        self._fire_rolls = []  # Pre-rolled fire decisions, redrawn once used up
+        self._fire_idx = 0
+
+    def draw_text(self, text, font, color, x, y, center=True, surface=None):
+        key = (text, id(font), color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
         rect = surf.get_rect()
         if center:
             rect.center = (x, y)
         else:
             rect.topleft = (x, y)
-        self.screen.blit(surf, rect)
+        (surface or self.screen).blit(surf, rect)
         return rect
 
+    def draw_counter(self, label, digits, x, y):
+        self.screen.blit(label, (x, y))
+        x += label.get_width()
+        for ch in digits:
+            self.screen.blit(self._digit_glyphs[ord(ch) - 48], (x, y))
+            x += self._digit_w
+
+    def _clear_bullets(self):
+        # Every bullet in flight as one row of top-left corner and vertical
+        # speed; player shots move up (speed < 0), alien shots move down
+        self._bullet_xy = np.empty((0, 2), dtype=np.int32)
+        self._bullet_speed = np.empty(0, dtype=np.int32)
+
+    def _add_bullet(self, x, y, speed):
+        # x is the bullet's centre and y its bottom edge
+        self._bullet_xy = np.vstack((self._bullet_xy, [(x - BULLET_W // 2, y - BULLET_H)]))
+        self._bullet_speed = np.append(self._bullet_speed, speed)
+
+    def _keep_bullets(self, keep):
+        self._bullet_xy = self._bullet_xy[keep]
+        self._bullet_speed = self._bullet_speed[keep]
+
+    def _advance_bullets(self):
+        ys = self._bullet_xy[:, 1]
+        ys += self._bullet_speed
+        gone = (ys + BULLET_H < 0) | (ys > HEIGHT)
+        if gone.any():
+            self._keep_bullets(~gone)
+
+    def _hit_player(self):
+        # Alien bullets touching the ship are used up by the hit
+        r = self.player.rect
+        bx = self._bullet_xy[:, 0]
+        by = self._bullet_xy[:, 1]
+        touching = (self._bullet_speed > 0) & (bx < r.right) & (r.x < bx + BULLET_W) & (by < r.bottom) & (r.y < by + BULLET_H)
+        if not touching.any():
+            return False
+        self._keep_bullets(~touching)
+        return True
+
+    def _alien_fires(self):
+        if self._fire_idx >= len(self._fire_rolls):
+            self._fire_rolls = (self._rng.random(FIRE_ROLL_BATCH) < self.alien_fire_chance).tolist()
+            self._fire_idx = 0
+        self._fire_idx += 1
+        return self._fire_rolls[self._fire_idx - 1]
+
+    def _shoot_aliens(self):
+        # Player bullets against the formation as one (bullets, aliens) AABB test
+        mine = self._bullet_speed < 0
+        if not mine.any() or not self._alien_sprites:
+            return
+        b = self._bullet_xy[mine]
+        ax = self._alien_xy[:, 0]
+        ay = self._alien_xy[:, 1]
+        bx, by = b[:, 0:1], b[:, 1:2]
+        mask = (bx < ax + ALIEN_SIZE) & (ax < bx + BULLET_W) & (by < ay + ALIEN_SIZE) & (ay < by + BULLET_H)
+        if not mask.any():
+            return
+
+        spent = np.zeros(len(mine), dtype=bool)
+        spent[mine] = mask.any(axis=1)
+        self._keep_bullets(~spent)
+        hit = mask.any(axis=0)
+        for _ in range(np.count_nonzero(hit)):
+            self.sfx.play_explode()
+        self.score += int(self._alien_points[hit].sum())
+
+        # Kill the hit aliens and drop their rows
+        keep = ~hit
+        survivors = []
+        for alien, alive in zip(self._alien_sprites, keep.tolist()):
+            if alive:
+                survivors.append(alien)
+            else:
+                alien.kill()
+        self._alien_sprites = survivors
+        self._alien_xy = self._alien_xy[keep]
+        self._alien_points = self._alien_points[keep]
+
     def update(self):
         if self.state == "PLAY":
-            self.all_sprites.update()
+            # One keyboard snapshot per frame, shared with the player sprite
+            keys = pygame.key.get_pressed()
+            self.all_sprites.update(keys=keys)
+            self._advance_bullets()
+
+            # Sprite list of the live formation; stays valid until the
+            # collision pass below kills anything
+            aliens = self._alien_sprites
 
             # Alien movement logic
-            if self.aliens:
-                num_aliens = len(self.aliens)
+            if aliens:
+                num_aliens = len(aliens)
                 self.alien_move_delay = max(5, int(30 - (50 - num_aliens) * 0.5))
                 
                 self.alien_move_timer += 1
                 if self.alien_move_timer >= self.alien_move_delay:
                     self.alien_move_timer = 0
                     
-                    change_dir = False
-                    for alien in self.aliens:
-                        if (self.alien_dir == 1 and alien.rect.right >= WIDTH - 10) or \
-                           (self.alien_dir == -1 and alien.rect.left <= 10):
-                            change_dir = True
-                            break
-                    
+                    xy = self._alien_xy
+                    if self.alien_dir == 1:
+                        change_dir = xy[:, 0].max() + ALIEN_SIZE >= WIDTH - 10
+                    else:
+                        change_dir = xy[:, 0].min() <= 10
+
                     if change_dir:
                         self.alien_dir *= -1
-                        for alien in self.aliens:
-                            alien.rect.y += 20
-                            if alien.rect.bottom >= self.player.rect.top:
-                                self.state = "GAMEOVER"
-                                self.sfx.play_explode()
+                        xy[:, 1] += 20
+                        landed = np.count_nonzero(xy[:, 1] + ALIEN_SIZE >= self.player.rect.top)
+                        for _ in range(landed):
+                            self.state = "GAMEOVER"
+                            self.sfx.play_explode()
                     else:
                         step = 8 
-                        for alien in self.aliens:
-                            alien.rect.x += self.alien_dir * step
+                        xy[:, 0] += self.alien_dir * step
+
+                    for alien, pos in zip(aliens, xy.tolist()):
+                        alien.rect.topleft = pos
+                        alien.dirty = 1
 
             # Alien shooting
-            if self.aliens and random.random() < self.alien_fire_chance:
-                shooter = random.choice(list(self.aliens))
-                bullet = Bullet(shooter.rect.centerx, shooter.rect.bottom, 3, CLR_ENEMY_BULLET)
-                self.enemy_bullets.add(bullet)
-                self.all_sprites.add(bullet)
+            if aliens and self._alien_fires():
+                shooter = random.choice(aliens)
+                self._add_bullet(shooter.rect.centerx, shooter.rect.bottom, 3)
 
             # Player shooting
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_SPACE] and self.player.shoot_cooldown == 0 and len(self.player_bullets) < 3:
-                bullet = Bullet(self.player.rect.centerx, self.player.rect.top, -8, CLR_PLAYER)
-                self.player_bullets.add(bullet)
-                self.all_sprites.add(bullet)
+            if keys[pygame.K_SPACE] and self.player.shoot_cooldown == 0 and np.count_nonzero(self._bullet_speed < 0) < 3:
+                self._add_bullet(self.player.rect.centerx, self.player.rect.top, -8)
                 self.player.shoot_cooldown = 15
                 self.sfx.play_shoot()
 
             # Collisions
-            hits = pygame.sprite.groupcollide(self.player_bullets, self.aliens, True, True)
-            for hit_list in hits.values():
-                for alien in hit_list:
-                    self.score += alien.points
-                    self.sfx.play_explode()
+            self._shoot_aliens()
 
-            if pygame.sprite.spritecollide(self.player, self.enemy_bullets, True):
+            if self._hit_player():
                 self.sfx.play_explode()
                 self.lives -= 1
                 if self.lives <= 0:
                     self.state = "GAMEOVER"
                 else:
                     self.player.rect.midbottom = (WIDTH//2, HEIGHT-20)
-                    self.player_bullets.empty()
-                    self.enemy_bullets.empty()
+                    self.player.dirty = 1
+                    self._clear_bullets()
 
             if not self.aliens:
                 self.score += 100
@@ -318,6 +491,8 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.VIDEOEXPOSE:
+                self._full_redraw = True  # Window contents were lost
 
             if event.type == pygame.KEYDOWN:
                 if self.state == "MENU":
@@ -347,51 +522,55 @@ class Game:
                         self.state = "MENU"
 
     def draw(self):
-        self.screen.blit(self.bg, (0, 0))
+        full = self._full_redraw or self.state != self._drawn_state
+        # Menu and info screens are still images: leave the last frame on
+        # screen until the state or the menu cursor changes
+        if self.state != "PLAY" and not full and self.menu_idx == self._drawn_menu_idx:
+            return
+        self._drawn_state = self.state
+        self._drawn_menu_idx = self.menu_idx
+        self._full_redraw = False
+        if self.state == "PLAY":
+            # The sprite group repaints background and sprites under last
+            # frame's bullets and the HUD, or everything after a state change
+            if full:
+                self.all_sprites.repaint_rect(self.screen.get_rect())
+            else:
+                for r in self._bullet_rects:
+                    self.all_sprites.repaint_rect(r)
+            self.all_sprites.repaint_rect(HUD_RECT)
+        else:
+            # Info screens are entirely in their pre-rendered background
+            self.screen.blit(self._state_bgs.get(self.state, self.bg), (0, 0))
 
         if self.state == "MENU":
-            self.draw_text("Cat's! Space invaders", self.font_title, CLR_ALIEN_H, WIDTH//2, 80)
             for i, option in enumerate(self.menu_options):
                 color = CLR_PLAYER if i == self.menu_idx else CLR_UI_TEXT
                 prefix = "> " if i == self.menu_idx else "  "
                 self.draw_text(f"{prefix}{option}", self.font_main, color, WIDTH//2, 180 + i * 40)
-            self.draw_text("Use UP/DOWN to navigate, ENTER to select", self.font_main, CLR_UI_ACCENT, WIDTH//2, HEIGHT - 40)
 
         elif self.state == "PLAY":
-            self.all_sprites.draw(self.screen)
-            self.draw_text(f"SCORE: {self.score:06d}", self.font_main, CLR_UI_TEXT, 80, 20, center=False)
-            self.draw_text(f"LIVES: {self.lives}", self.font_main, CLR_UI_TEXT, WIDTH - 80, 20, center=False)
+            dirty = self.all_sprites.draw(self.screen, self.bg)
+            self._bullet_rects = []
+            for (x, y), speed in zip(self._bullet_xy.tolist(), self._bullet_speed.tolist()):
+                surf = self._ebullet_surf if speed > 0 else self._pbullet_surf
+                self._bullet_rects.append(self.screen.blit(surf, (x, y)))
+            dirty += self._bullet_rects  # HUD_RECT is already in dirty via repaint_rect
+            self.draw_counter(self._score_label, f"{self.score:06d}", 80, 20)
+            self.draw_counter(self._lives_label, str(self.lives), WIDTH - 80, 20)
             for i in range(self.lives):
                 x = WIDTH - 100 + i * 15
                 pygame.draw.rect(self.screen, CLR_PLAYER, (x, 40, 10, 8))
 
-        elif self.state == "HOW_TO_PLAY":
-            self.draw_text("HOW TO PLAY", self.font_title, CLR_ALIEN_M, WIDTH//2, 60)
-            instructions = ["LEFT/RIGHT ARROWS - Move ship", "SPACEBAR - Fire laser", "Destroy all alien invaders!", "", "Aliens move faster as there", "are fewer of them.", "", "Avoid enemy fire and prevent", "aliens from reaching the bottom."]
-            for i, line in enumerate(instructions):
-                self.draw_text(line, self.font_main, CLR_UI_TEXT, WIDTH//2, 120 + i * 25)
-            self.draw_text("PRESS ENTER TO RETURN", self.font_main, CLR_UI_ACCENT, WIDTH//2, HEIGHT - 40)
-
-        elif self.state == "CREDITS":
-            self.draw_text("CREDITS", self.font_title, CLR_ALIEN_M, WIDTH//2, 60)
-            credits = ["Game Design & Programming:", "AC Computing Gaming Division", "", "Sound Design:", "GBA Style SFX Synthesizer", "", "Special Thanks:", "Space Invaders (1978)", "Famicom/NES Developers", "", "[C] 1999-2026"]
-            for i, line in enumerate(credits):
-                self.draw_text(line, self.font_main, CLR_UI_TEXT, WIDTH//2, 120 + i * 25)
-            self.draw_text("PRESS ENTER TO RETURN", self.font_main, CLR_UI_ACCENT, WIDTH//2, HEIGHT - 40)
-
-        elif self.state == "ABOUT":
-            self.draw_text("ABOUT", self.font_title, CLR_ALIEN__L, WIDTH//2, 60)
-            about_text = ["Cat's! Space invaders", "", "A retro-style space shooter", "inspired by classic arcade", "games from the Famicom/NES era.", "", "Features authentic 8-bit style", "graphics and GBA-inspired", "sound effects.", "", "Created with PyGame"]
-            for i, line in enumerate(about_text):
-                self.draw_text(line, self.font_main, CLR_UI_TEXT, WIDTH//2, 120 + i * 25)
-            self.draw_text("PRESS ENTER TO RETURN", self.font_main, CLR_UI_ACCENT, WIDTH//2, HEIGHT - 40)
-
         elif self.state == "GAMEOVER":
             self.draw_text("GAME OVER", self.font_title, (255, 50, 50), WIDTH//2, HEIGHT//2 - 40)
             self.draw_text(f"FINAL SCORE: {self.score}", self.font_main, CL_UI_TEXT := CLR_UI_TEXT, WIDTH//2, HEIGHT//2)
             self.draw_text("PRESS ENTER TO RETURN TO MENU", self.font_main, CLR_UI_ACCENT, WIDTH//2, HEIGHT//2 + 60)
 
-        pygame.display.flip()
+        if self.state == "PLAY" and not full:
+            pygame.display.update(dirty)
+        else:
+            pygame.display.flip()
 
     def run(self):
         while self.running:
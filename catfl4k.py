@@ -17,6 +17,7 @@ import os
 import wave
 import struct
 import random
+from functools import lru_cache
 from tkinter import simpledialog, colorchooser
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -46,6 +47,16 @@ except ImportError:
     import tkinter as tk
     from tkinter import ttk, filedialog, messagebox, Canvas
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional; fall back to plain Python kernels
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    prange = range
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SECTION 1: AUDIO ENGINE CORE (Standardized for stability)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -54,12 +65,23 @@ SAMPLE_RATE = 44100
 BLOCK_SIZE = 512
 MAX_VOICES = 64
 
+# Equal-power pan law, indexed by round(pan * (PAN_RES - 1)) for pan in [0, 1]
+PAN_RES = 1024
+_PAN_IDX = np.arange(PAN_RES) / (PAN_RES - 1)
+PAN_L = np.cos(_PAN_IDX * np.pi / 2).astype(np.float32)
+PAN_R = np.sin(_PAN_IDX * np.pi / 2).astype(np.float32)
+
+@njit(cache=True)
+def _pan_index(pan):
+    return int(pan * (PAN_RES - 1) + 0.5)
+
 # ─── DSP / Synthesis ──────────────────────────────────────────────────────────
 
-def _butter_filter(data, cutoff, sr, btype='high', order=4):
-    """Numpy-based FFT filter to replace scipy."""
-    n = len(data)
-    if n == 0: return data
+_RNG = np.random.default_rng()
+
+@lru_cache(maxsize=32)
+def _fft_gain(n, cutoff, sr, btype, order):
+    """Butterworth-style magnitude response for an n-point rfft (shared, read-only)."""
     freqs = np.fft.rfftfreq(n, d=1/sr)
     epsilon = 1e-10
     
@@ -69,29 +91,40 @@ def _butter_filter(data, cutoff, sr, btype='high', order=4):
         with np.errstate(divide='ignore', invalid='ignore'):
             gain = 1.0 / np.sqrt(1.0 + ((cutoff) / (freqs + epsilon))**(2 * order))
         gain[0] = 0.0
+    gain.flags.writeable = False
+    return gain
 
+def _butter_filter(data, cutoff, sr, btype='high', order=4):
+    """Numpy-based FFT filter to replace scipy."""
+    n = len(data)
+    if n == 0: return data
     spectrum = np.fft.rfft(data)
-    filtered = np.fft.irfft(spectrum * gain, n=n)
+    spectrum *= _fft_gain(n, cutoff, sr, btype, order)
+    filtered = np.fft.irfft(spectrum, n=n)
     return filtered.astype(np.float32)
 
 def synth_kick(duration=0.5):
     n = int(SAMPLE_RATE * duration)
-    t = np.arange(n) / SAMPLE_RATE
-    # Pitch envelope
-    freq = 150 * np.exp(-t / 0.07) + 50
-    phase = 2 * np.pi * np.cumsum(freq) / SAMPLE_RATE
-    sig = np.sin(phase) * np.exp(-t / 0.3)
+    t = np.arange(n, dtype=np.float32) / SAMPLE_RATE
+    # Pitch envelope, integrated to phase; all float32 and reusing one buffer
+    freq = np.exp(-t / 0.07)
+    freq *= 150
+    freq += 50
+    phase = np.cumsum(freq, dtype=np.float32)
+    phase *= 2 * np.pi / SAMPLE_RATE
+    sig = np.sin(phase, out=phase)
+    sig *= np.exp(-t / 0.3)
     # Transient
-    click = np.random.normal(0, 1, int(0.005 * SAMPLE_RATE)) * 0.5
+    click = _RNG.standard_normal(int(0.005 * SAMPLE_RATE), dtype=np.float32) * 0.5
     sig[:len(click)] += click
     max_val = np.max(np.abs(sig))
     return (sig / max_val).astype(np.float32) if max_val > 0 else sig
 
 def synth_snare(duration=0.25):
     n = int(SAMPLE_RATE * duration)
-    t = np.arange(n) / SAMPLE_RATE
+    t = np.arange(n, dtype=np.float32) / SAMPLE_RATE
     tone = np.sin(2 * np.pi * 180 * t) * np.exp(-t / 0.05)
-    noise = np.random.normal(0, 1, n) * np.exp(-t / 0.12)
+    noise = _RNG.standard_normal(n, dtype=np.float32) * np.exp(-t / 0.12)
     noise = _butter_filter(noise, 1000, SAMPLE_RATE, 'high')
     sig = 0.4 * tone + 0.6 * noise
     max_val = np.max(np.abs(sig))
@@ -99,12 +132,12 @@ def synth_snare(duration=0.25):
 
 def synth_hat(duration=0.08, open_hat=False):
     n = int(SAMPLE_RATE * duration)
-    t = np.arange(n) / SAMPLE_RATE
+    t = np.arange(n, dtype=np.float32) / SAMPLE_RATE
     # Metallic noise
-    sig = np.random.normal(0, 1, n)
+    sig = _RNG.standard_normal(n, dtype=np.float32)
     # Add square waves for metallic body
-    for f in [300, 540, 800]:
-        sig += np.sign(np.sin(2 * np.pi * f * t)) * 0.2
+    freqs = np.array([300, 540, 800], dtype=np.float32)[:, None]
+    sig += np.sign(np.sin(2 * np.pi * freqs * t)).sum(axis=0) * 0.2
     sig = _butter_filter(sig, 7000, SAMPLE_RATE, 'high')
     decay = 0.3 if open_hat else 0.04
     sig *= np.exp(-t / decay)
@@ -113,15 +146,13 @@ def synth_hat(duration=0.08, open_hat=False):
 
 def synth_clap(duration=0.4):
     n = int(SAMPLE_RATE * duration)
-    t = np.arange(n) / SAMPLE_RATE
-    noise = np.random.normal(0, 1, n)
+    t = np.arange(n, dtype=np.float32) / SAMPLE_RATE
+    noise = _RNG.standard_normal(n, dtype=np.float32)
     noise = _butter_filter(noise, 1200, SAMPLE_RATE, 'high')
-    # Burst envelope
-    env = np.zeros(n)
-    for i in range(4):
-        st = int(i * 0.012 * SAMPLE_RATE)
-        if st < n:
-            env[st:] += np.exp(-np.arange(n-st)/ (SAMPLE_RATE*0.005))
+    # Burst envelope: four decays starting 12ms apart
+    starts = (np.arange(4) * 0.012 * SAMPLE_RATE).astype(int)[:, None]
+    since = np.arange(n, dtype=np.float32) - starts.astype(np.float32)
+    env = np.where(since >= 0, np.exp(-np.maximum(since, 0) / (SAMPLE_RATE*0.005)), 0.0).sum(axis=0)
     if np.max(env) > 0: env /= np.max(env)
     sig = noise * env * np.exp(-t/0.2)
     max_val = np.max(np.abs(sig))
@@ -129,27 +160,135 @@ def synth_clap(duration=0.4):
 
 # ─── Audio Engine Logic ───────────────────────────────────────────────────────
 
-class Voice:
-    __slots__ = ['data', 'pos', 'vol', 'pan']
-    def __init__(self, data, vol=1.0, pan=0.5):
-        self.data = data
-        self.pos = 0
-        self.vol = vol
-        self.pan = pan
+@njit(cache=True, nogil=True, fastmath=True)
+def _mix_voices(out, kit_pcm, kit_offsets, kit_lens, v_ch, v_pos, v_vol, v_gain_l, v_gain_r,
+                n_voices, peaks):
+    """Mix voices into out (frames, 2) in one pass; advances v_pos and
+    raises peaks[channel] to each voice's block peak.
+
+    v_gain_l/v_gain_r are vol * pan gain, folded together at trigger time.
+    """
+    frames = out.shape[0]
+    for v in range(n_voices):
+        ch = v_ch[v]
+        pos = v_pos[v]
+        count = min(frames, kit_lens[ch] - pos)
+        if count <= 0:
+            continue
+        l_gain = v_gain_l[v]
+        r_gain = v_gain_r[v]
+        base = kit_offsets[ch] + pos
+        peak = 0.0
+        for i in range(count):
+            s = kit_pcm[base + i]
+            out[i, 0] += s * l_gain
+            out[i, 1] += s * r_gain
+            a = abs(s)
+            if a > peak:
+                peak = a
+        peaks[ch] = max(peaks[ch], peak * v_vol[v])
+        v_pos[v] = pos + count
+
+@njit(cache=True, nogil=True)
+def _compact_voices(v_ch, v_pos, v_vol, v_gain_l, v_gain_r, kit_lens, n):
+    """Pack the voices that still have samples left to the front; returns the new count."""
+    w = 0
+    for r in range(n):
+        if v_pos[r] < kit_lens[v_ch[r]]:
+            if w != r:
+                v_ch[w] = v_ch[r]
+                v_pos[w] = v_pos[r]
+                v_vol[w] = v_vol[r]
+                v_gain_l[w] = v_gain_l[r]
+                v_gain_r[w] = v_gain_r[r]
+            w += 1
+    return w
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _finish_block(out):
+    """Clamp out to [-1, 1] in place; returns the peak from before the clamp."""
+    peak = 0.0
+    for i in range(out.shape[0]):
+        for c in range(2):
+            s = out[i, c]
+            a = abs(s)
+            if a > peak:
+                peak = a
+            if s > 1.0:
+                out[i, c] = 1.0
+            elif s < -1.0:
+                out[i, c] = -1.0
+    return peak
+
+EXPORT_CHUNK = 4096
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _render_export(out, kit_pcm, kit_offsets, kit_lens, hit_t, hit_ch, hit_l, hit_r):
+    """Offline mix of every hit into out. Each thread owns a run of output
+    frames and adds whatever part of each hit falls inside it, so
+    overlapping hits never race."""
+    total = out.shape[0]
+    n_chunks = (total + EXPORT_CHUNK - 1) // EXPORT_CHUNK
+    for c in prange(n_chunks):
+        lo = c * EXPORT_CHUNK
+        hi = min(lo + EXPORT_CHUNK, total)
+        for h in range(hit_t.shape[0]):
+            t = hit_t[h]
+            ch = hit_ch[h]
+            a = max(lo, t)
+            b = min(hi, t + kit_lens[ch])
+            if a >= b:
+                continue
+            src = kit_offsets[ch] - t
+            seg = kit_pcm[src + a:src + b]
+            out[a:b, 0] += seg * hit_l[h]
+            out[a:b, 1] += seg * hit_r[h]
 
 class AudioEngine:
     def __init__(self):
-        self.bpm = 140
+        self.set_bpm(140)
         self.playing = False
         self.song_mode = False # False=Pat, True=Song
         self.recording = False
         self.sample_pos = 0
         self.stream = None
         self.channels = [] 
-        self.voices = []
-        self.meter_levels = [0.0] * 10
+        # Active voices as parallel arrays; the first n_active slots are live
+        self.v_data_idx = np.zeros(MAX_VOICES, dtype=np.int64)
+        self.v_pos = np.zeros(MAX_VOICES, dtype=np.int64)
+        self.v_vol = np.zeros(MAX_VOICES, dtype=np.float32)
+        self.v_gain_l = np.zeros(MAX_VOICES, dtype=np.float32)
+        self.v_gain_r = np.zeros(MAX_VOICES, dtype=np.float32)
+        self.n_active = 0
+        self._mix_buf = np.zeros((BLOCK_SIZE, 2), dtype=np.float32)
+        self.meter_levels = np.zeros(10, dtype=np.float32)
+        self._mix_energy_buf = np.zeros_like(self.meter_levels)
         self.current_step = 0
-        
+        self._step_count = 0   # steps fired since play
+        self._next_trigger = 0 # sample_pos of the next step
+        self._reset_pending = False # stop requested; the callback rewinds the transport
+        self._step_plan = [[] for _ in range(16)] # step -> [(ch, vol, gain_l, gain_r)]
+        self.kit_pcm = np.zeros(0, dtype=np.float32)
+        self.kit_offsets = np.zeros(0, dtype=np.int64)
+        self.kit_lens = np.zeros(0, dtype=np.int64)
+        
+        # Compile the mixer now so the first audio block doesn't stall on the JIT.
+        # Both kernels run with the GIL released, so Tk redraws can't hold up the mix.
+        _mix_voices(np.zeros((1, 2), dtype=np.float32), np.zeros(1, dtype=np.float32),
+                    np.zeros(1, dtype=np.int64), np.ones(1, dtype=np.int64),
+                    np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64),
+                    np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32),
+                    np.zeros(1, dtype=np.float32), 1, np.zeros(1, dtype=np.float32))
+        _compact_voices(self.v_data_idx, self.v_pos, self.v_vol, self.v_gain_l, self.v_gain_r,
+                        np.ones(1, dtype=np.int64), 0)
+        _finish_block(np.zeros((1, 2), dtype=np.float32))
+        
+    def set_bpm(self, bpm):
+        if bpm <= 0: raise ValueError("bpm must be positive")
+        self.bpm = bpm
+        # Whole samples per 16th note; the sequencer steps on this exact grid
+        self._samples_per_step = int(round((60 / bpm / 4) * SAMPLE_RATE))
+
     def load_kit(self):
         # Create standard "Trap/HipHop" kit
         self.channels = [
@@ -159,81 +298,95 @@ class AudioEngine:
             {'name': 'Hat (O)',   'data': synth_hat(0.4, True),  'color': '#80D8FF', 'steps': [0,0,1,0,0,0,1,0,0,0,1,0,0,0,1,0], 'vol': 0.6, 'pan': 0.6},
             {'name': 'Snare',     'data': synth_snare(),         'color': '#00E5FF', 'steps': [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1], 'vol': 0.8, 'pan': 0.5},
         ]
-        self.meter_levels = [0.0] * (len(self.channels) + 1) # +1 for Master
+        self.meter_levels = np.zeros(len(self.channels) + 1, dtype=np.float32) # +1 for Master
+        self._mix_energy_buf = np.zeros_like(self.meter_levels)
+        
+        # Flat copy of the kit for the mixer kernel
+        lens = [len(ch['data']) for ch in self.channels]
+        self.kit_pcm = np.concatenate([ch['data'] for ch in self.channels]).astype(np.float32)
+        self.kit_lens = np.array(lens, dtype=np.int64)
+        self.kit_offsets = np.concatenate(([0], np.cumsum(lens)[:-1])).astype(np.int64)
+        self.rebuild_step_plan()
+
+    def rebuild_step_plan(self):
+        """Resolve which voices each step fires; call after editing steps, vol or pan."""
+        plan = [[] for _ in range(16)]
+        for i, ch in enumerate(self.channels):
+            p = _pan_index(ch['pan'])
+            hit = (i, ch['vol'], ch['vol'] * PAN_L[p], ch['vol'] * PAN_R[p])
+            for s in range(16):
+                if ch['steps'][s]:
+                    plan[s].append(hit)
+        self._step_plan = plan # swapped whole so the audio thread never sees a partial plan
 
     def callback(self, outdata, frames, time, status):
-        out = np.zeros((frames, 2), dtype=np.float32)
+        if frames > len(self._mix_buf):
+            self._mix_buf = np.zeros((frames, 2), dtype=np.float32)
+        out = self._mix_buf[:frames]
+        out.fill(0)
+        
+        if self._reset_pending:
+            # Rewind here rather than in play_stop, so the transport counters are
+            # only ever written by the audio thread and can't be caught mid-block
+            self._reset_pending = False
+            self.sample_pos = 0
+            self.current_step = 0
+            self._step_count = 0
+            self._next_trigger = 0
+            self.n_active = 0
         
         if self.playing:
-            sps = (60 / self.bpm / 4) * SAMPLE_RATE
-            start = self.sample_pos
-            end = start + frames
+            end = self.sample_pos + frames
             
             # Sequencer Logic
-            start_step = int(start / sps)
-            end_step = int(end / sps)
-            
-            for s in range(start_step, end_step + 1):
-                trigger_time = int(s * sps)
-                if start <= trigger_time < end:
-                    offset = trigger_time - start
-                    step_idx = s % 16
-                    self.current_step = step_idx
-                    
-                    # Pattern Mode looping logic (Song mode placeholder)
-                    for ch in self.channels:
-                        if ch['steps'][step_idx]:
-                            # In song mode we would check playlist, here we assume PAT mode for audio engine demo
-                            self.voices.append(Voice(ch['data'], ch['vol'], ch['pan']))
+            while self._next_trigger < end:
+                step_idx = self._step_count % 16
+                self.current_step = step_idx
+                
+                # Pattern Mode looping logic (Song mode placeholder)
+                # In song mode we would check playlist, here we assume PAT mode for audio engine demo
+                for i, vol, gain_l, gain_r in self._step_plan[step_idx]:
+                    v = self.n_active
+                    if v == MAX_VOICES: break
+                    self.v_data_idx[v] = i
+                    self.v_pos[v] = 0
+                    self.v_vol[v] = vol
+                    self.v_gain_l[v] = gain_l
+                    self.v_gain_r[v] = gain_r
+                    self.n_active += 1
+                
+                self._step_count += 1
+                self._next_trigger += self._samples_per_step
                             
-            self.sample_pos += frames
+            self.sample_pos = end
 
         # Render Voices
-        active = []
-        mix_energy = [0.0] * len(self.meter_levels)
-        
-        for v in self.voices:
-            remain = len(v.data) - v.pos
-            if remain <= 0: continue
-            
-            count = min(frames, remain)
-            chunk = v.data[v.pos:v.pos+count] * v.vol
-            
-            # Panning
-            l_gain = np.cos(v.pan * np.pi / 2)
-            r_gain = np.sin(v.pan * np.pi / 2)
-            
-            out[:count, 0] += chunk * l_gain
-            out[:count, 1] += chunk * r_gain
+        mix_energy = self._mix_energy_buf
+        mix_energy.fill(0)
+        n = self.n_active
+        if n:
+            _mix_voices(out, self.kit_pcm, self.kit_offsets, self.kit_lens,
+                        self.v_data_idx, self.v_pos, self.v_vol, self.v_gain_l, self.v_gain_r,
+                        n, mix_energy)
             
-            v.pos += count
-            if v.pos < len(v.data):
-                active.append(v)
-            
-            # Metering (Approximate)
-            peak = np.max(np.abs(chunk))
-            # Find channel index (slow lookup but fine for 5 chans)
-            for i, ch in enumerate(self.channels):
-                if ch['data'] is v.data:
-                    mix_energy[i] = max(mix_energy[i], peak)
-        
-        self.voices = active
+            self.n_active = _compact_voices(self.v_data_idx, self.v_pos, self.v_vol,
+                                            self.v_gain_l, self.v_gain_r, self.kit_lens, n)
         
-        # Master Meter
-        master_peak = np.max(np.abs(out)) if len(out) > 0 else 0
-        mix_energy[-1] = master_peak
+        # Master Meter + clip in one pass
+        mix_energy[-1] = _finish_block(out)
         
         # Update shared meter state with decay
-        for i in range(len(self.meter_levels)):
-            self.meter_levels[i] = max(mix_energy[i], self.meter_levels[i] * 0.9)
+        self.meter_levels *= 0.9
+        np.maximum(mix_energy, self.meter_levels, out=self.meter_levels)
 
-        # Soft clip
-        np.clip(out, -1.0, 1.0, out=out)
         outdata[:] = out
 
     def start(self):
         try:
-            self.stream = sd.OutputStream(channels=2, callback=self.callback, samplerate=SAMPLE_RATE, blocksize=BLOCK_SIZE)
+            # float32 matches _mix_buf, so PortAudio takes the block without a conversion
+            self.stream = sd.OutputStream(channels=2, callback=self.callback, samplerate=SAMPLE_RATE, blocksize=BLOCK_SIZE,
+                                          dtype='float32', latency='low',
+                                          prime_output_buffers_using_stream_callback=True)
             self.stream.start()
         except:
             print("Audio Device Error - Running in silent mode")
@@ -241,45 +394,47 @@ class AudioEngine:
     def play_stop(self):
         if self.playing:
             self.playing = False
-            self.sample_pos = 0
-            self.current_step = 0
-            self.voices = []
+            self._reset_pending = True
         else:
             self.playing = True
             
     def export_wav(self, path):
         # Render 4 loops
-        sps = int((60 / self.bpm / 4) * SAMPLE_RATE)
+        sps = self._samples_per_step
         total_len = sps * 16 * 4
         out = np.zeros((total_len, 2), dtype=np.float32)
         
-        for bar in range(4):
-            for s in range(16):
-                time_idx = (bar * 16 + s) * sps
-                for ch in self.channels:
-                    if ch['steps'][s]:
-                        l_gain = np.cos(ch['pan'] * np.pi / 2)
-                        r_gain = np.sin(ch['pan'] * np.pi / 2)
-                        
-                        slen = len(ch['data'])
-                        if time_idx + slen < total_len:
-                            out[time_idx:time_idx+slen, 0] += ch['data'] * ch['vol'] * l_gain
-                            out[time_idx:time_idx+slen, 1] += ch['data'] * ch['vol'] * r_gain
+        # Flatten the step plan into one row per hit
+        hits = [((bar * 16 + s) * sps, i, gain_l, gain_r)
+                for bar in range(4) for s in range(16)
+                for i, vol, gain_l, gain_r in self._step_plan[s]
+                if (bar * 16 + s) * sps + self.kit_lens[i] < total_len]
+        hit_t = np.array([h[0] for h in hits], dtype=np.int64)
+        hit_ch = np.array([h[1] for h in hits], dtype=np.int64)
+        hit_l = np.array([h[2] for h in hits], dtype=np.float32)
+        hit_r = np.array([h[3] for h in hits], dtype=np.float32)
+        _render_export(out, self.kit_pcm, self.kit_offsets, self.kit_lens, hit_t, hit_ch, hit_l, hit_r)
 
         # Normalize and save
         m = np.max(np.abs(out))
-        if m > 0: out /= m
+        np.multiply(out, 32767 / m if m > 0 else 32767, out=out)
         
         with wave.open(path, 'w') as f:
             f.setnchannels(2)
             f.setsampwidth(2)
             f.setframerate(SAMPLE_RATE)
-            f.writeframes((out * 32767).astype(np.int16).tobytes())
+            # Convert a slice at a time so the int16 copy never exceeds one chunk
+            for i in range(0, total_len, 8192):
+                f.writeframesraw(out[i:i+8192].astype(np.int16).tobytes())
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SECTION 2: UI (FL STUDIO 26 AESTHETIC)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# One sine period for the scope, indexed by phase * SIN_LUT_RES / 2pi
+SIN_LUT_RES = 256
+SIN_LUT = np.sin(np.arange(SIN_LUT_RES) * (2 * np.pi / SIN_LUT_RES)).astype(np.float32)
+
 class CatStudio26:
     # ── THEME 26 ──────────────────────────────────────────────────────────────
     C = {
@@ -310,11 +465,21 @@ class CatStudio26:
         # UI State
         self.meter_ids = []
         self.step_ids = {} # (ch, step) -> id
-        self.knob_ids = {} # (ch, type) -> id
+        self.knob_ids = {} # (ch, type) -> (needle id, cx, cy)
+        self.ch_label_ids = {} # ch -> (color strip id, name text id)
         self.playhead_id = None
         self.playlist_playhead_id = None
         self.scope_line = None
         self.cpu_line = None
+        self._last_coords = {} # (canvas, item id) -> coords last sent to Tk
+        self._cpu_ticks = 0
+        self._last_time_text = None
+        self._scope_xs = np.arange(0, 300, 5, dtype=np.float32) # scope sample x positions
+        self._scope_env = np.sin(self._scope_xs * 0.05)
+        self._scope_phase = self._scope_xs * (0.1 * SIN_LUT_RES / (2 * math.pi)) + 0.5 # LUT index, rounded
+        self._scope_pts = np.empty((len(self._scope_xs), 2), dtype=np.float32) # (x, y) pairs, reused each tick
+        self._scope_pts[:, 0] = self._scope_xs
+        self._scope_idle = False # flat line already drawn
         
         # Toolstrip State
         self.pat_mode_btn = None
@@ -493,13 +658,14 @@ class CatStudio26:
         b.pack(side="left", padx=2)
         return b
 
-    def draw_knob(self, canvas, x, y, val, color, tags):
-        canvas.create_oval(x-9, y-9, x+9, y+9, fill="#222", outline="#444", tags=tags)
+    def knob_needle(self, x, y, val):
         angle = 135 + (val * 270)
         rad = math.radians(angle)
-        ix = x + 8 * math.cos(rad)
-        iy = y + 8 * math.sin(rad)
-        canvas.create_line(x, y, ix, iy, fill=color, width=2, tags=tags)
+        return x, y, x + 8 * math.cos(rad), y + 8 * math.sin(rad)
+
+    def draw_knob(self, canvas, x, y, val, color, tags):
+        canvas.create_oval(x-9, y-9, x+9, y+9, fill="#222", outline="#444", tags=tags)
+        return canvas.create_line(*self.knob_needle(x, y, val), fill=color, width=2, tags=tags)
 
     # ── DRAWING & INTERACTION ──
 
@@ -514,18 +680,16 @@ class CatStudio26:
         y += 5
 
         for i, ch in enumerate(self.engine.channels):
-            tags_ch = f"ch_name_{i}"
+            tags_ch = (f"ch_name_{i}", "ch_name")
             self.cv_rack.create_rectangle(60, y, 210, y+26, fill="#34373F", outline="#000", tags=tags_ch)
-            self.cv_rack.create_rectangle(205, y+2, 208, y+24, fill=ch['color'], outline="", tags=tags_ch)
-            self.cv_rack.create_text(70, y+13, text=ch['name'], fill="white", anchor="w", font=("Segoe UI", 9, "bold"), tags=tags_ch)
-            
-            self.cv_rack.tag_bind(tags_ch, "<Button-3>", lambda e, ci=i: self.on_channel_right_click(e, ci))
+            strip = self.cv_rack.create_rectangle(205, y+2, 208, y+24, fill=ch['color'], outline="", tags=tags_ch)
+            label = self.cv_rack.create_text(70, y+13, text=ch['name'], fill="white", anchor="w", font=("Segoe UI", 9, "bold"), tags=tags_ch)
+            self.ch_label_ids[i] = (strip, label)
 
-            self.draw_knob(self.cv_rack, 20, y+13, ch['pan'], self.C["knob"], (f"knob_pan_{i}", "knob"))
-            self.draw_knob(self.cv_rack, 45, y+13, ch['vol'], self.C["knob"], (f"knob_vol_{i}", "knob"))
-            
-            self.cv_rack.tag_bind(f"knob_pan_{i}", "<Button-3>", lambda e, ci=i: self.reset_knob(ci, 'pan'))
-            self.cv_rack.tag_bind(f"knob_vol_{i}", "<Button-3>", lambda e, ci=i: self.reset_knob(ci, 'vol'))
+            kid = self.draw_knob(self.cv_rack, 20, y+13, ch['pan'], self.C["knob"], (f"knob_pan_{i}", "knob"))
+            self.knob_ids[(i, 'pan')] = (kid, 20, y+13)
+            kid = self.draw_knob(self.cv_rack, 45, y+13, ch['vol'], self.C["knob"], (f"knob_vol_{i}", "knob"))
+            self.knob_ids[(i, 'vol')] = (kid, 45, y+13)
 
             for s in range(16):
                 x = 220 + s * 32
@@ -537,16 +701,26 @@ class CatStudio26:
                 else:
                     fill_col = self.C["bg_step_off"] if grp == 0 else "#263238"
                 
-                tags_step = f"step_{i}_{s}"
+                tags_step = (f"step_{i}_{s}", "step")
                 rid = self.cv_rack.create_rectangle(x, y, x+28, y+26, fill=fill_col, outline="#111", width=1, tags=tags_step)
-                
-                self.cv_rack.tag_bind(rid, "<Button-1>", lambda e, ci=i, si=s: self.step_action(ci, si, True))
-                self.cv_rack.tag_bind(rid, "<Button-3>", lambda e, ci=i, si=s: self.step_action(ci, si, False))
                 self.step_ids[(i, s)] = rid
 
             y += 36
 
         self.playhead_id = self.cv_rack.create_line(220, 0, 220, y, fill="#FFF", width=2, stipple="gray50")
+        
+        # One binding per item kind; the clicked item's own tag says which channel/step
+        self.cv_rack.tag_bind("step", "<Button-1>", lambda e: self.on_step_click(e, True))
+        self.cv_rack.tag_bind("step", "<Button-3>", lambda e: self.on_step_click(e, False))
+        self.cv_rack.tag_bind("knob", "<Button-3>", self.on_knob_right_click)
+        self.cv_rack.tag_bind("ch_name", "<Button-3>", self.on_channel_tag_click)
+
+    def current_tag_args(self, prefix):
+        # "step_2_5" -> ['2', '5'] for the rack item under the pointer
+        for t in self.cv_rack.gettags("current"):
+            if t.startswith(prefix):
+                return t[len(prefix):].split("_")
+        return None
 
     def draw_playlist(self):
         cv = self.cv_playlist
@@ -618,13 +792,11 @@ class CatStudio26:
             mid = cv.create_rectangle(meter_x, 280, meter_x+8, 280, fill=self.C["accent"], outline="")
             
             # Map logical channel to mixer strip
-            # Master = 0, Chan 0-4 = Strip 1-5
+            # Master = 0, Chan 0-4 = Strip 1-5; unused inserts get no meter entry
             if is_master:
-                self.meter_ids.append((mid, -1)) # -1 index for master logic
+                self.meter_ids.append((mid, -1, meter_x)) # master is the last engine meter
             elif i <= 5:
-                self.meter_ids.append((mid, i-1)) # audio chan index
-            else:
-                self.meter_ids.append((mid, None)) # Unused
+                self.meter_ids.append((mid, i-1, meter_x)) # audio chan index
 
             # Fader Track line
             cv.create_line(x+15, 90, x+15, 280, fill="#000", width=2)
@@ -657,12 +829,25 @@ class CatStudio26:
     def toggle_play(self):
         self.engine.play_stop()
 
+    def on_step_click(self, event, is_left_click):
+        args = self.current_tag_args("step_")
+        if args: self.step_action(int(args[0]), int(args[1]), is_left_click)
+
+    def on_knob_right_click(self, event):
+        args = self.current_tag_args("knob_")
+        if args: self.reset_knob(int(args[1]), args[0])
+
+    def on_channel_tag_click(self, event):
+        args = self.current_tag_args("ch_name_")
+        if args: self.on_channel_right_click(event, int(args[0]))
+
     def step_action(self, ch_idx, step_idx, is_left_click):
         if is_left_click:
             val = self.engine.channels[ch_idx]['steps'][step_idx]
             self.engine.channels[ch_idx]['steps'][step_idx] = 1 - val
         else:
             self.engine.channels[ch_idx]['steps'][step_idx] = 0
+        self.engine.rebuild_step_plan()
         self.update_step_visual(ch_idx, step_idx)
 
     def update_step_visual(self, ch_idx, step_idx):
@@ -685,21 +870,23 @@ class CatStudio26:
         new_name = simpledialog.askstring("Rename", "New Name:", parent=self.root)
         if new_name:
             self.engine.channels[ch_idx]['name'] = new_name
-            self.draw_rack() # Redraw to update name
+            self.cv_rack.itemconfig(self.ch_label_ids[ch_idx][1], text=new_name)
 
     def color_channel(self, ch_idx):
         col = colorchooser.askcolor(title="Choose Channel Color", parent=self.root)[1]
         if col:
             self.engine.channels[ch_idx]['color'] = col
-            self.draw_rack()
+            self.cv_rack.itemconfig(self.ch_label_ids[ch_idx][0], fill=col)
 
     def reset_knob(self, ch_idx, k_type):
         if k_type == 'vol': self.engine.channels[ch_idx]['vol'] = 0.8
         elif k_type == 'pan': self.engine.channels[ch_idx]['pan'] = 0.5
-        self.draw_rack()
+        self.engine.rebuild_step_plan()
+        kid, x, y = self.knob_ids[(ch_idx, k_type)]
+        self.cv_rack.coords(kid, *self.knob_needle(x, y, self.engine.channels[ch_idx][k_type]))
 
     def update_bpm(self, e):
-        try: self.engine.bpm = int(self.ent_bpm.get())
+        try: self.engine.set_bpm(int(self.ent_bpm.get()))
         except: pass
             
     def do_export(self):
@@ -708,49 +895,60 @@ class CatStudio26:
             self.engine.export_wav(f)
             messagebox.showinfo("Cat's Studio 26", "Export Complete! 🎵")
 
+    def set_coords(self, cv, item, *coords):
+        # Each coords() is a Tcl round-trip; skip it when the item is already there
+        key = (cv, item)
+        if self._last_coords.get(key) != coords:
+            self._last_coords[key] = coords
+            cv.coords(item, *coords)
+
     def animate(self):
         # 1. Update Mixer Meters
-        for mid, ch_idx in self.meter_ids:
-            if ch_idx is None: continue
-            
-            # Map engine meter index. Master is -1 in engine, but here we store logic differently
-            if ch_idx == -1: # Master
-                level = self.engine.meter_levels[-1]
-            else:
-                level = self.engine.meter_levels[ch_idx]
-                
-            h = level * 190
-            coords = self.cv_mixer.coords(mid)
-            if coords:
-                self.cv_mixer.coords(mid, coords[0], 280 - h, coords[2], 280)
+        levels = self.engine.meter_levels
+        for mid, meter_idx, mx in self.meter_ids:
+            h = int(levels[meter_idx] * 190)
+            self.set_coords(self.cv_mixer, mid, mx, 280 - h, mx + 8, 280)
 
         # 2. Update Rack Playhead
         if self.engine.playing:
-            s = self.engine.current_step
-            x = 220 + s * 32
-            self.cv_rack.coords(self.playhead_id, x, 0, x, 220)
+            x = 220 + self.engine.current_step * 32
+            self.set_coords(self.cv_rack, self.playhead_id, x, 0, x, 220)
             
             # Move playlist playhead (simulation)
-            px = 60 + (self.engine.sample_pos / 44100) * 100 # Arbitrary speed
+            px = int(60 + (self.engine.sample_pos / 44100) * 100) # Arbitrary speed
             px = px % 1000 # loop visually
-            self.cv_playlist.coords(self.playlist_playhead_id, px, 0, px, 600)
+            self.set_coords(self.cv_playlist, self.playlist_playhead_id, px, 0, px, 600)
             
             mins, secs = divmod(int(self.engine.sample_pos / 44100), 60)
-            self.lbl_time.config(text=f"{mins:03}:{secs:02}:00")
+            time_text = f"{mins:03}:{secs:02}:00"
+            if time_text != self._last_time_text:
+                self._last_time_text = time_text
+                self.lbl_time.config(text=time_text)
 
         # 3. Scope
         amp = self.engine.meter_levels[-1]
-        pts = []
-        t = time.time()
-        for i in range(0, 300, 5):
-            y = 30 + math.sin(i*0.1 + t*15) * (amp * 25) * math.sin(i*0.05)
-            pts.extend([i, y])
-        if len(pts) > 2:
-            self.cv_scope.coords(self.scope_line, *pts)
+        if amp < 1e-3:
+            # Silent: draw the flat line once and leave it
+            if not self._scope_idle:
+                self._scope_idle = True
+                self.cv_scope.coords(self.scope_line, 0, 30, 300, 30)
+        else:
+            self._scope_idle = False
+            phase = (time.time() * 15) % (2 * math.pi) * (SIN_LUT_RES / (2 * math.pi)) # wrap before it meets float32
+            idx = (self._scope_phase + phase).astype(np.int32) & (SIN_LUT_RES - 1)
+            y = self._scope_pts[:, 1]
+            np.take(SIN_LUT, idx, out=y)
+            y *= self._scope_env
+            y *= amp * 25
+            y += 30
+            self.cv_scope.coords(self.scope_line, self._scope_pts.ravel().tolist())
             
-        # CPU
-        cpu_h = random.randint(5, 14)
-        self.cpu_cv.coords(self.cpu_line, 0, 15, 60, 15-cpu_h)
+        # CPU (cosmetic; a new reading every ~300 ms is plenty)
+        self._cpu_ticks += 1
+        if self._cpu_ticks >= 10:
+            self._cpu_ticks = 0
+            cpu_h = random.randint(5, 14)
+            self.set_coords(self.cpu_cv, self.cpu_line, 0, 15, 60, 15-cpu_h)
 
         self.root.after(30, self.animate)
 
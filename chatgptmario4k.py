@@ -1,13 +1,21 @@
 
-import sys, random, math
-import pygame
-
-# Ultra Platformer 1.0 (original demo) - 60 FPS fixed-step, 600x400 window.
+import sys, random, math, threading
+import numpy as np
+import pygame  # pygame or pygame-ce (same API, faster blits): pip uninstall pygame && pip install pygame-ce
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; fall back to plain Python kernels
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Ultra Platformer 1.0 (original demo) - 60 FPS fixed-step, 300x200 scaled up to the window.
 # NOTE: This is NOT a 1:1 clone of any commercial game; all levels are procedural & original.
 
-WINDOW_W, WINDOW_H = 600, 400
-LOGICAL_W, LOGICAL_H = 300, 200   # rendered to a smaller surface then scaled 2x -> 600x400 (pixel-crisp)
-SCALE = 2
+LOGICAL_W, LOGICAL_H = 300, 200   # drawn at this size; the SCALED window lets SDL upscale it (pixel-crisp)
 
 FPS = 60
 DT = 1.0 / FPS
@@ -30,6 +38,7 @@ JUMP_VEL = -420.0            # px/s
 RUN_JUMP_BONUS = -40.0       # px/s (extra jump when running)
 
 ENEMY_SPEED = 60.0           # px/s
+WALKER_W, WALKER_H = 10, 10  # px
 
 # Tiles
 EMPTY = 0
@@ -39,12 +48,72 @@ PLATFORM = 3
 GOAL = 4  # non-solid; touching completes stage
 
 SOLID_TILES = {GROUND, BRICK, PLATFORM}
+IS_SOLID = np.zeros(256, dtype=bool)  # tile id -> solid, for array lookups
+IS_SOLID[list(SOLID_TILES)] = True
 
-def clamp(x, a, b):
-    return a if x < a else b if x > b else x
+# Colors
+SKY = (40, 60, 110)
+GROUND_C = (60, 160, 80)
+BRICK_C = (170, 90, 60)
+PLATFORM_C = (120, 120, 160)
+GOAL_C = (240, 240, 120)
+PLAYER_C = (230, 230, 255)
+ENEMY_C = (255, 140, 140)
+
+TILE_COLORS = {GROUND: GROUND_C, BRICK: BRICK_C, PLATFORM: PLATFORM_C, GOAL: GOAL_C}
+
+# Keys read every tick
+K_LEFT, K_RIGHT = pygame.K_LEFT, pygame.K_RIGHT
+K_X, K_LSHIFT, K_RSHIFT = pygame.K_x, pygame.K_LSHIFT, pygame.K_RSHIFT  # run
+K_Z, K_SPACE = pygame.K_z, pygame.K_SPACE                               # jump
 
-def sign(x):
-    return -1 if x < 0 else 1 if x > 0 else 0
+def clamp(x, a, b):
+    return min(max(x, a), b)
+
+@njit(cache=True)
+def _any_solid(solid, col_top, tx0, tx1, ty0, ty1):
+    # inclusive tile box; everything outside the stage counts as EMPTY.
+    # Each column is scanned from its topmost solid row (col_top) down.
+    tx0, ty0 = max(tx0, 0), max(ty0, 0)
+    tx1, ty1 = min(tx1, solid.shape[1] - 1), min(ty1, solid.shape[0] - 1)
+    for tx in range(tx0, tx1 + 1):
+        for ty in range(max(ty0, col_top[tx]), ty1 + 1):
+            if solid[ty, tx]:
+                return True
+    return False
+
+@njit(cache=True)
+def resolve_x(solid, col_top, x0, x1, y, w, h):
+    """Move a w x h box at height y from x0 to x1, walking the tile columns its
+    leading edge enters, nearest first. Stops flush against the first one holding
+    a solid tile. Returns (x, column), column -1 if nothing was hit."""
+    left0, left1, top = int(x0), int(x1), int(y)
+    lo, hi = top // TILE, (top + h - 1) // TILE
+    if left1 > left0:
+        for tx in range((left0 + w - 1) // TILE + 1, (left1 + w - 1) // TILE + 1):
+            if _any_solid(solid, col_top, tx, tx, lo, hi):
+                return float(tx * TILE - w), tx
+    else:
+        for tx in range(left0 // TILE - 1, left1 // TILE - 1, -1):
+            if _any_solid(solid, col_top, tx, tx, lo, hi):
+                return float((tx + 1) * TILE), tx
+    return float(x1), -1
+
+@njit(cache=True)
+def resolve_y(solid, col_top, x, y0, y1, w, h):
+    """resolve_x for the vertical move of a box at x from y0 to y1.
+    Returns (y, row), row -1 if nothing was hit."""
+    top0, top1, left = int(y0), int(y1), int(x)
+    lo, hi = left // TILE, (left + w - 1) // TILE
+    if top1 > top0:
+        for ty in range((top0 + h - 1) // TILE + 1, (top1 + h - 1) // TILE + 1):
+            if _any_solid(solid, col_top, lo, hi, ty, ty):
+                return float(ty * TILE - h), ty
+    else:
+        for ty in range(top0 // TILE - 1, top1 // TILE - 1, -1):
+            if _any_solid(solid, col_top, lo, hi, ty, ty):
+                return float((ty + 1) * TILE), ty
+    return float(y1), -1
 
 class Player:
     def __init__(self, x, y):
@@ -57,24 +126,14 @@ class Player:
         self.on_ground = False
         self.dead_timer = 0.0
         self.facing = 1  # -1 left, +1 right
+        self._rect = pygame.Rect(int(self.x), int(self.y), self.w, self.h)
 
     @property
     def rect(self):
-        return pygame.Rect(int(self.x), int(self.y), self.w, self.h)
-
-class Walker:
-    def __init__(self, x, y, direction=-1):
-        self.w = 10
-        self.h = 10
-        self.x = float(x)
-        self.y = float(y)
-        self.vx = ENEMY_SPEED * direction
-        self.vy = 0.0
-        self.alive = True
-
-    @property
-    def rect(self):
-        return pygame.Rect(int(self.x), int(self.y), self.w, self.h)
+        # One shared Rect, moved to the current position on each access
+        self._rect.x = int(self.x)
+        self._rect.y = int(self.y)
+        return self._rect
 
 class Stage:
     def __init__(self, world, stage):
@@ -85,12 +144,14 @@ class Stage:
         # Width grows with world/stage a bit, capped for performance.
         base = 170
         self.width = int(clamp(base + world * 8 + stage * 6, 170, 240))  # tiles
-        self.grid = [[EMPTY for _ in range(self.width)] for _ in range(self.height)]
-        self.walkers = []
+        self.grid = np.zeros((self.height, self.width), dtype=np.uint8)  # tile ids, [ty, tx]
+        self.solid = np.zeros((self.height, self.width), dtype=bool)      # rebuilt from grid once _generate is done
+        self.walker_spawns = []  # (x, y, direction); walkers are rebuilt from these on reset()
         self.goal_x = (self.width - 4) * TILE
         self.spawn_x = 2 * TILE
         self.spawn_y = (self.ground_row() - 3) * TILE
         self._generate()
+        self.bg = self._bake()
 
     def ground_row(self):
         # second-to-last row; falling below LOGICAL_H kills.
@@ -102,20 +163,16 @@ class Stage:
     def tile_at(self, tx, ty):
         if not self.in_bounds(tx, ty):
             return EMPTY
-        return self.grid[ty][tx]
-
-    def set_tile(self, tx, ty, t):
-        if self.in_bounds(tx, ty):
-            self.grid[ty][tx] = t
+        return self.grid[ty, tx]
 
     def _generate(self):
         rng = random.Random(1337 + self.world * 1000 + self.stage * 97)
 
         g = self.ground_row()
 
+        # Structures are written straight into grid; solid is derived from it at the end.
         # Start with solid ground
-        for x in range(self.width):
-            self.grid[g][x] = GROUND
+        self.grid[g, :] = GROUND
 
         # Carve gaps (pits)
         x = 12
@@ -123,8 +180,7 @@ class Stage:
             # Skip a little at the start; later worlds have more pits
             if rng.random() < (0.10 + 0.02 * self.world + 0.01 * self.stage):
                 gap = rng.randint(2, 4 + self.world // 2)
-                for gx in range(x, min(self.width, x + gap)):
-                    self.grid[g][gx] = EMPTY
+                self.grid[g, x:x + gap] = EMPTY
                 x += gap + rng.randint(6, 14)
             else:
                 x += rng.randint(6, 12)
@@ -135,56 +191,73 @@ class Stage:
             py = rng.choice([g - 3, g - 4, g - 5, g - 6])
             length = rng.randint(2, 7)
             t = rng.choice([BRICK, PLATFORM])
-            for i in range(length):
-                self.set_tile(px + i, py, t)
+            self.grid[py, px:px + length] = t
 
         # Add some "columns" (pipes-like but generic)
         for _ in range(5 + self.world // 2):
             cx = rng.randint(18, self.width - 18)
             h = rng.randint(2, 5)
-            for k in range(h):
-                self.set_tile(cx, g - 1 - k, BRICK)
-                self.set_tile(cx + 1, g - 1 - k, BRICK)
+            self.grid[g - h:g, cx:cx + 2] = BRICK
 
         # Stairs near the end (classic platformer trope; original layout)
         stair_base = self.width - 22
         stair_h = 3 + self.world // 2
-        for i in range(1, stair_h + 1):
-            for k in range(i):
-                self.set_tile(stair_base + i, g - 1 - k, BRICK)
+        steps = np.tri(stair_h, dtype=bool)[:, ::-1]  # column i (from 1) is i tiles tall
+        self.grid[g - stair_h:g, stair_base + 1:stair_base + stair_h + 1][steps] = BRICK
 
         # Goal marker (non-solid column)
         goal_tx = self.width - 4
-        for yy in range(g - 7, g):
-            if 0 <= yy < self.height:
-                self.set_tile(goal_tx, yy, GOAL)
-        self.set_tile(goal_tx + 1, g - 1, BRICK)  # small base
+        self.grid[max(g - 7, 0):g, goal_tx] = GOAL
+        self.grid[g - 1, goal_tx + 1] = BRICK  # small base
+        self.solid[:] = IS_SOLID[self.grid]
 
         # Enemies
         for _ in range(6 + self.world):
             ex = rng.randint(18, self.width - 28) * TILE
             # only place on solid ground
-            if self.grid[g][ex // TILE] == GROUND:
-                self.walkers.append(Walker(ex, (g * TILE) - 10, direction=rng.choice([-1, 1])))
+            if self.grid[g, ex // TILE] == GROUND:
+                # stand on top of any column/stair built over that spot
+                top = g
+                while top > 0 and self.solid[top - 1, ex // TILE]:
+                    top -= 1
+                self.walker_spawns.append((ex, (top * TILE) - 10, rng.choice([-1, 1])))
+
+        # Topmost solid row per column (height if none), so collision scans skip the sky
+        self.col_top = np.where(self.solid.any(axis=0), self.solid.argmax(axis=0), self.height)
+        self.reset()
+
+    def reset(self):
+        # Put the stage back to its freshly generated state (only walkers change in play).
+        # Walkers are kept as parallel arrays, one slot per spawn.
+        spawns = np.array(self.walker_spawns, dtype=np.float64).reshape(-1, 3)
+        self.wx = spawns[:, 0].copy()
+        self.wy = spawns[:, 1].copy()
+        self.wvx = spawns[:, 2] * ENEMY_SPEED
+        self.wvy = np.zeros(len(spawns))
+        self.walive = np.ones(len(spawns), dtype=bool)
+        self._wrect = pygame.Rect(0, 0, WALKER_W, WALKER_H)
+
+    def walker_rect(self, i):
+        # Shared scratch Rect; valid until the next call
+        self._wrect.x = int(self.wx[i])
+        self._wrect.y = int(self.wy[i])
+        return self._wrect
+
+    def _bake(self):
+        # Tiles never change after generation, so draw the whole stage once
+        # and let Game.draw blit the camera's window of it.
+        bg = pygame.Surface((self.width * TILE, LOGICAL_H))
+        bg.fill(SKY)
+        for ty, tx in np.argwhere(self.grid != EMPTY):
+            bg.fill(TILE_COLORS[self.grid[ty, tx]], (tx * TILE, ty * TILE, TILE, TILE))
+        if pygame.display.get_surface() is not None:
+            bg = bg.convert()  # match the display format so the per-frame blit is a plain copy
+        return bg
 
     def is_solid_at_pixel(self, px, py):
         tx = int(px) // TILE
         ty = int(py) // TILE
-        return self.tile_at(tx, ty) in SOLID_TILES
-
-    def rect_collide_solids(self, rect):
-        # iterate tiles overlapped by rect
-        left = rect.left // TILE
-        right = (rect.right - 1) // TILE
-        top = rect.top // TILE
-        bottom = (rect.bottom - 1) // TILE
-        hits = []
-        for ty in range(top, bottom + 1):
-            for tx in range(left, right + 1):
-                t = self.tile_at(tx, ty)
-                if t in SOLID_TILES:
-                    hits.append(pygame.Rect(tx * TILE, ty * TILE, TILE, TILE))
-        return hits
+        return self.in_bounds(tx, ty) and bool(self.solid[ty, tx])
 
     def rect_hits_goal(self, rect):
         left = rect.left // TILE
@@ -201,11 +274,11 @@ class Stage:
 class Game:
     def __init__(self):
         pygame.init()
-        pygame.display.set_caption("Ultra Platformer 1.0 (Original) — 60 FPS, 600x400")
-        self.window = pygame.display.set_mode((WINDOW_W, WINDOW_H))
-        self.surface = pygame.Surface((LOGICAL_W, LOGICAL_H))
+        pygame.display.set_caption("Ultra Platformer 1.0 (Original) — 60 FPS")
+        self.window = pygame.display.set_mode((LOGICAL_W, LOGICAL_H), pygame.SCALED | pygame.DOUBLEBUF)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 18)
+        self._hud_cache = {}  # text -> rendered surface
 
         self.stage_order = [f"{w}-{s}" for w in range(1, 9) for s in range(1, 5)]
         self.stage_index = 0
@@ -216,16 +289,39 @@ class Game:
         self.message_timer = 0.0
         self.completed = False
         self.complete_timer = 0.0
+        self._jump_was_down = False
+
+        # Stages are deterministic per id, so build them all once in the background
+        self._stage_cache = {}
+        threading.Thread(target=self._pregen, daemon=True).start()
 
         self.load_stage(self.stage_order[self.stage_index])
 
+        # Compile the collision kernels now so the first tick doesn't stall on the JIT.
+        # The player passes float positions, walkers int pre-move corners: warm both.
+        solid, col_top = self.stage.solid, self.stage.col_top
+        resolve_x(solid, col_top, 0.0, 0.0, 0.0, 1, 1)
+        resolve_y(solid, col_top, 0.0, 0.0, 0.0, 1, 1)
+        resolve_x(solid, col_top, 0, 0.0, 0, 1, 1)
+        resolve_y(solid, col_top, 0.0, 0, 0.0, 1, 1)
+
     def parse_stage_id(self, sid):
         w, s = sid.split("-")
         return int(w), int(s)
 
+    def _pregen(self):
+        for sid in self.stage_order:
+            if sid not in self._stage_cache:
+                self._stage_cache.setdefault(sid, Stage(*self.parse_stage_id(sid)))
+
     def load_stage(self, sid):
-        w, s = self.parse_stage_id(sid)
-        self.stage = Stage(w, s)
+        stage = self._stage_cache.get(sid)
+        if stage is None:
+            # not generated yet; build it here rather than wait for the worker
+            stage = self._stage_cache[sid] = Stage(*self.parse_stage_id(sid))
+        else:
+            stage.reset()
+        self.stage = stage
         self.player = Player(self.stage.spawn_x, self.stage.spawn_y)
         self.camera_x = 0.0
         self.completed = False
@@ -284,10 +380,10 @@ class Game:
             return
 
         # Player input
-        left = keys[pygame.K_LEFT]
-        right = keys[pygame.K_RIGHT]
-        run = keys[pygame.K_x] or keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]
-        jump_pressed = keys[pygame.K_z] or keys[pygame.K_SPACE]
+        left = keys[K_LEFT]
+        right = keys[K_RIGHT]
+        run = keys[K_X] or keys[K_LSHIFT] or keys[K_RSHIFT]
+        jump_pressed = keys[K_Z] or keys[K_SPACE]
 
         accel = RUN_ACCEL if run else WALK_ACCEL
         max_speed = MAX_RUN if run else MAX_WALK
@@ -303,13 +399,11 @@ class Game:
             if abs(self.player.vx) <= fric * dt:
                 self.player.vx = 0.0
             else:
-                self.player.vx -= sign(self.player.vx) * fric * dt
+                self.player.vx -= fric * dt if self.player.vx > 0 else -fric * dt
 
-        self.player.vx = clamp(self.player.vx, -max_speed, max_speed)
+        self.player.vx = min(max(self.player.vx, -max_speed), max_speed)
 
         # Jump (edge-triggered)
-        if not hasattr(self, "_jump_was_down"):
-            self._jump_was_down = False
         if jump_pressed and not self._jump_was_down and self.player.on_ground:
             bonus = RUN_JUMP_BONUS if run else 0.0
             self.player.vy = JUMP_VEL + bonus
@@ -318,7 +412,7 @@ class Game:
 
         # Gravity
         self.player.vy += GRAVITY * dt
-        self.player.vy = clamp(self.player.vy, -900.0, 900.0)
+        self.player.vy = min(max(self.player.vy, -900.0), 900.0)
 
         # Move & collide (X then Y)
         self.move_entity(self.player, dt)
@@ -328,23 +422,28 @@ class Game:
             self.restart_stage()
             return
 
-        # Update enemies
-        for w in self.stage.walkers:
-            if not w.alive:
-                continue
-            w.vy += GRAVITY * dt
-            w.vy = clamp(w.vy, -900.0, 900.0)
-            self.move_walker(w, dt)
-
-        # Player-enemy interaction
+        # Update enemies: gravity and integration for all live walkers at once,
+        # then collide each one against the tiles
+        st = self.stage
+        alive = st.walive
+        np.add(st.wvy, GRAVITY * dt, out=st.wvy, where=alive)
+        np.clip(st.wvy, -900.0, 900.0, out=st.wvy)
+        ox = st.wx.astype(np.int64)  # rect corners before the move, for the sweep
+        oy = st.wy.astype(np.int64)
+        np.add(st.wx, st.wvx * dt, out=st.wx, where=alive)
+        np.add(st.wy, st.wvy * dt, out=st.wy, where=alive)
+        for i in np.flatnonzero(alive):
+            self.move_walker(i, int(ox[i]), int(oy[i]))
+
+        # Player-enemy interaction: only walkers within a couple of tiles can touch
         pr = self.player.rect
-        for w in self.stage.walkers:
-            if not w.alive:
-                continue
-            if pr.colliderect(w.rect):
+        near = alive & (np.abs(st.wx - self.player.x) < 2 * TILE)
+        for i in np.flatnonzero(near):
+            wr = st.walker_rect(i)
+            if pr.colliderect(wr):
                 # Stomp if falling and above enemy
-                if self.player.vy > 0 and pr.bottom - w.rect.top < 10:
-                    w.alive = False
+                if self.player.vy > 0 and pr.bottom - wr.top < 10:
+                    alive[i] = False
                     self.player.vy = JUMP_VEL * 0.6
                 else:
                     self.restart_stage()
@@ -361,127 +460,72 @@ class Game:
         self.camera_x = clamp(target, 0.0, max(0.0, stage_px_w - LOGICAL_W))
 
     def move_entity(self, ent, dt):
-        # Horizontal
-        ent.x += ent.vx * dt
-        rect = ent.rect
-        hits = self.stage.rect_collide_solids(rect)
-        for tile_rect in hits:
-            if ent.vx > 0:
-                rect.right = tile_rect.left
-                ent.x = rect.x
-                ent.vx = 0.0
-            elif ent.vx < 0:
-                rect.left = tile_rect.right
-                ent.x = rect.x
-                ent.vx = 0.0
+        solid, col_top = self.stage.solid, self.stage.col_top
+
+        # Horizontal: stop flush against the first solid column crossed
+        ent.x, tx = resolve_x(solid, col_top, ent.x, ent.x + ent.vx * dt, ent.y, ent.w, ent.h)
+        if tx >= 0:
+            ent.vx = 0.0
 
         # Vertical
-        ent.y += ent.vy * dt
-        rect = ent.rect
-        hits = self.stage.rect_collide_solids(rect)
-        ent.on_ground = False
-        for tile_rect in hits:
-            if ent.vy > 0:
-                rect.bottom = tile_rect.top
-                ent.y = rect.y
-                ent.vy = 0.0
-                ent.on_ground = True
-            elif ent.vy < 0:
-                rect.top = tile_rect.bottom
-                ent.y = rect.y
-                ent.vy = 0.0
-
-    def move_walker(self, w, dt):
-        # Horizontal
-        w.x += w.vx * dt
-        rect = w.rect
-        hits = self.stage.rect_collide_solids(rect)
-        for tile_rect in hits:
-            if w.vx > 0:
-                rect.right = tile_rect.left
-                w.x = rect.x
-                w.vx *= -1
-            elif w.vx < 0:
-                rect.left = tile_rect.right
-                w.x = rect.x
-                w.vx *= -1
+        ent.y, ty = resolve_y(solid, col_top, ent.x, ent.y, ent.y + ent.vy * dt, ent.w, ent.h)
+        ent.on_ground = ty >= 0 and ent.vy > 0
+        if ty >= 0:
+            ent.vy = 0.0
+
+    def move_walker(self, i, ox, oy):
+        # Walker i has already been moved by update; (ox, oy) is its rect corner before.
+        st = self.stage
+
+        # Horizontal: bounce off the first solid column crossed
+        vx = st.wvx[i]
+        x, tx = resolve_x(st.solid, st.col_top, ox, st.wx[i], oy, WALKER_W, WALKER_H)
+        st.wx[i] = x
+        if tx >= 0:
+            vx = st.wvx[i] = -vx
 
         # Edge turn-around: if no ground ahead, flip direction
-        ahead_x = (rect.centerx + sign(w.vx) * (w.w // 2 + 2))
-        foot_y = rect.bottom + 1
-        if not self.stage.is_solid_at_pixel(ahead_x, foot_y):
-            w.vx *= -1
+        ahead_x = int(x) + (WALKER_W + 2 if vx > 0 else -2)  # centre +/- (half width + 2)
+        foot_y = oy + WALKER_H + 1
+        if not st.is_solid_at_pixel(ahead_x, foot_y):
+            st.wvx[i] = -vx
 
         # Vertical
-        w.y += w.vy * dt
-        rect = w.rect
-        hits = self.stage.rect_collide_solids(rect)
-        for tile_rect in hits:
-            if w.vy > 0:
-                rect.bottom = tile_rect.top
-                w.y = rect.y
-                w.vy = 0.0
-            elif w.vy < 0:
-                rect.top = tile_rect.bottom
-                w.y = rect.y
-                w.vy = 0.0
+        st.wy[i], ty = resolve_y(st.solid, st.col_top, x, oy, st.wy[i], WALKER_W, WALKER_H)
+        if ty >= 0:
+            st.wvy[i] = 0.0
+
+    def render_text(self, txt):
+        # Font rendering is slow and the HUD strings rarely change, so keep each one
+        surf = self._hud_cache.get(txt)
+        if surf is None:
+            surf = self._hud_cache[txt] = self.font.render(txt, True, (255, 255, 255))
+        return surf
 
     def draw(self):
-        # Colors
-        SKY = (40, 60, 110)
-        GROUND_C = (60, 160, 80)
-        BRICK_C = (170, 90, 60)
-        PLATFORM_C = (120, 120, 160)
-        GOAL_C = (240, 240, 120)
-        PLAYER_C = (230, 230, 255)
-        ENEMY_C = (255, 140, 140)
-
-        self.surface.fill(SKY)
-
-        # Draw tiles in view
-        start_tx = int(self.camera_x) // TILE
-        end_tx = min(self.stage.width, start_tx + COLS_VIEW + 2)
-
-        for ty in range(self.stage.height):
-            for tx in range(start_tx, end_tx):
-                t = self.stage.grid[ty][tx]
-                if t == EMPTY:
-                    continue
-                x = tx * TILE - int(self.camera_x)
-                y = ty * TILE
-                r = pygame.Rect(x, y, TILE, TILE)
-                if t == GROUND:
-                    pygame.draw.rect(self.surface, GROUND_C, r)
-                elif t == BRICK:
-                    pygame.draw.rect(self.surface, BRICK_C, r)
-                elif t == PLATFORM:
-                    pygame.draw.rect(self.surface, PLATFORM_C, r)
-                elif t == GOAL:
-                    pygame.draw.rect(self.surface, GOAL_C, r)
-
-        # Draw enemies
-        for w in self.stage.walkers:
-            if not w.alive:
-                continue
-            r = w.rect.move(-int(self.camera_x), 0)
-            pygame.draw.rect(self.surface, ENEMY_C, r)
-
-        # Draw player
-        pr = self.player.rect.move(-int(self.camera_x), 0)
-        pygame.draw.rect(self.surface, PLAYER_C, pr)
+        # Tiles in view: one blit from the stage's pre-drawn background. It is opaque
+        # and the camera never leaves the stage, so it covers the whole frame.
+        view = pygame.Rect(int(self.camera_x), 0, LOGICAL_W, LOGICAL_H)
+        self.window.blit(self.stage.bg, (0, 0), view)
+
+        # Draw enemies and player (their rects are shared scratch, so shift in place)
+        cam = int(self.camera_x)
+        for i in np.flatnonzero(self.stage.walive):
+            r = self.stage.walker_rect(i)
+            r.x -= cam
+            pygame.draw.rect(self.window, ENEMY_C, r)
+
+        pr = self.player.rect
+        pr.x -= cam
+        pygame.draw.rect(self.window, PLAYER_C, pr)
 
         # HUD
         sid = self.stage.id
         txt = f"Stage {sid}  |  60 FPS fixed-step  |  Controls: ← → move, Z/Space jump, X/Shift run | N next, B prev, R restart"
-        hud = self.font.render(txt, True, (255, 255, 255))
-        self.surface.blit(hud, (6, 6))
+        self.window.blit(self.render_text(txt), (6, 6))
 
         if self.completed:
-            done = self.font.render("Stage clear! Loading next…", True, (255, 255, 255))
-            self.surface.blit(done, (6, 24))
-
-        # Scale up to window (nearest neighbor)
-        pygame.transform.scale(self.surface, (WINDOW_W, WINDOW_H), self.window)
+            self.window.blit(self.render_text("Stage clear! Loading next…"), (6, 24))
 
 if __name__ == "__main__":
     Game().run()